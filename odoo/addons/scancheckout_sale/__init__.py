@@ -0,0 +1,6 @@
+"""scancheckout_sale アドオンのエントリポイント。
+
+Odoo がアドオン読み込み時に import し、models 配下のモデル拡張を登録する。
+"""
+
+from . import models
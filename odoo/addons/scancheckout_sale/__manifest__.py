@@ -0,0 +1,10 @@
+# ScanCheckout 連携用の sale.order 拡張モジュール。
+{
+    "name": "ScanCheckout Sale",
+    "summary": "sale.order の作成と確定を1回の RPC で行うメソッドを追加する",
+    "version": "19.0.1.0.0",
+    "license": "Other OSI approved licence",
+    "depends": ["sale"],
+    "installable": True,
+    "application": False,
+}
@@ -0,0 +1,7 @@
+"""scancheckout_sale のモデル拡張を登録する。
+
+登録モデル
+- sale_order: sale.order.create_and_confirm
+"""
+
+from . import sale_order
@@ -0,0 +1,25 @@
+"""sale.order に ScanCheckout 向けの RPC メソッドを追加する。
+
+主要変数:
+    vals: sale.order.create に渡す値（API 側 _build_sale_order_vals が組み立てる）。
+
+Note:
+    - API 側で OdooConfig.sale_create_and_confirm を有効にした場合のみ使われる。
+    - create → action_confirm を同一トランザクションで実行するため、確定に
+      失敗した場合は作成もロールバックされる。
+"""
+
+from odoo import api, models
+
+
+class SaleOrder(models.Model):
+    """sale.order を継承し、作成と確定を1回で行う RPC メソッドを追加する。"""
+
+    _inherit = "sale.order"
+
+    @api.model
+    def create_and_confirm(self, vals):
+        """受注を作成して即時確定し、作成IDを返す。"""
+        order = self.create(vals)
+        order.action_confirm()
+        return order.id
@@ -6,24 +6,72 @@ uvicorn から `app.main:app` として参照される。
 - /health: 稼働確認
 - /scans: 画像アップロード・候補提示
 - /pos : チェックアウト関連エンドポイント
+
+Note:
+    - 終了時（lifespan）に Odoo 連携用の共有 HTTP クライアントを閉じる。
+    - レスポンスは ORJSONResponse で直列化する（Odoo 連携と同じ orjson を利用）。
+    - ルーターとその依存（Odoo クライアント、vision 等）は create_app() 内で
+      import する。`app` は初回参照時（uvicorn の `app.main:app` 解決時など）に
+      モジュール __getattr__（PEP 562）で生成する。
 """
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """アプリケーションの起動・終了処理。
+
+    Note:
+        - yield 以降は shutdown 時に実行される。
+    """
+    yield
+
+    from app.pos_adapters.odoo_jsonrpc import (
+        aclose_pooled_http_clients,
+        close_pooled_http_clients,
+    )
+
+    close_pooled_http_clients()
+    await aclose_pooled_http_clients()
+
+
+def create_app() -> FastAPI:
+    """FastAPI アプリケーションを生成する。
+
+    Note:
+        - 呼び出しごとに新しいインスタンスを返す（テストで独立したアプリを作れる）。
+    """
+    from app.routes.health import router as health_router
+    from app.routes.pos import router as pos_router
+    from app.routes.scans import router as scans_router
+
+    # FastAPI アプリケーションインスタンス。
+    application = FastAPI(
+        title="ScanCheckout API",
+        description="画像スキャン → 候補提示 → Odoo 登録 の業務ループを支える API。",
+        version="0.1.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
+
+    # ルーターを登録する。
+    application.include_router(health_router)
+    application.include_router(scans_router)
+    application.include_router(pos_router)
+    return application
+
 
-from app.routes.health import router as health_router
-from app.routes.pos import router as pos_router
-from app.routes.scans import router as scans_router
-
-# FastAPI アプリケーションインスタンス。
-app = FastAPI(
-    title="ScanCheckout API",
-    description="画像スキャン → 候補提示 → Odoo 登録 の業務ループを支える API。",
-    version="0.1.0",
-)
-
-# ルーターを登録する。
-app.include_router(health_router)
-app.include_router(scans_router)
-app.include_router(pos_router)
+def __getattr__(name: str) -> Any:
+    """`app` 属性の初回参照時にアプリケーションを生成する（PEP 562）。"""
+    if name == "app":
+        application = create_app()
+        globals()["app"] = application
+        return application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
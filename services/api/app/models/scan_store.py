@@ -12,15 +12,18 @@ Note:
 
 from __future__ import annotations
 
+import os
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from threading import Lock
-from typing import Any, Optional
-from uuid import uuid4
+from threading import Lock, local
+from typing import Any, BinaryIO, Optional
+from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanRecord:
     """1件のスキャンを表すレコード。
 
@@ -31,9 +34,12 @@ class ScanRecord:
         image_uri: 保存画像のローカル URI。
         content_type: アップロード時の MIME タイプ。
         size_bytes: 画像サイズ（バイト）。
-        created_at: 作成時刻（UTC）。
+        created_at: 作成時刻（UNIX エポックからのナノ秒）。
         detections: 推論結果（bbox + 候補）配列。
         model_version: 推論ロジックのバージョン識別子。
+
+    Note:
+        - slots=True によりインスタンスごとの __dict__ を持たない（メモリ削減）。
     """
 
     scan_id: str
@@ -42,13 +48,168 @@ class ScanRecord:
     image_uri: str
     content_type: str
     size_bytes: int
-    created_at: datetime
+    created_at: int
     detections: list[dict[str, Any]] = field(default_factory=list)
     model_version: Optional[str] = None
 
+    @property
+    def created_at_dt(self) -> datetime:
+        """created_at を UTC の datetime に変換して返す（API 応答用）。"""
+        return datetime.fromtimestamp(self.created_at / 1_000_000_000, timezone.utc)
+
+
+class _UuidPool:
+    """os.urandom をまとめて呼び、UUIDv4 文字列を切り出すプール。
+
+    Note:
+        - 4096 バイト（256 件分）を1回の os.urandom で補充する。
+        - スレッド間で共有しない（_next_scan_id 経由でスレッドごとに生成する）。
+    """
+
+    __slots__ = ("_buf", "_pos")
+
+    # 1回の補充で取得する乱数バイト数。
+    _REFILL_BYTES = 4096
+
+    def __init__(self) -> None:
+        """空のプールを生成する（初回の next_str で乱数を補充する）。
+
+        主要変数:
+            _buf: os.urandom でまとめて取得した乱数バイト列。
+            _pos: _buf の次に読み出す位置（16 バイト単位で進む）。
+        """
+        self._buf = b""
+        self._pos = 0
+
+    def next_str(self) -> str:
+        """次の UUIDv4 を文字列で返す。"""
+        if self._pos >= len(self._buf):
+            self._buf = os.urandom(self._REFILL_BYTES)
+            self._pos = 0
+        pos = self._pos
+        self._pos = pos + 16
+        return str(UUID(bytes=self._buf[pos : pos + 16], version=4))
+
+
+# スレッドごとの _UuidPool を保持する。
+_UUID_POOLS = local()
+
+
+def _reset_uuid_pools() -> None:
+    """fork 後の子プロセスで親と同じ乱数列を使わないよう破棄する。"""
+    global _UUID_POOLS
+    _UUID_POOLS = local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_uuid_pools)
+
+
+def _next_scan_id() -> str:
+    """呼び出しスレッドのプールから scan_id を払い出す。"""
+    pool = getattr(_UUID_POOLS, "pool", None)
+    if pool is None:
+        pool = _UUID_POOLS.pool = _UuidPool()
+    return pool.next_str()
+
+
+class EmptyScanImageError(ValueError):
+    """アップロード画像が空であることを表す例外。"""
+
+
+class ScanImageTooLargeError(ValueError):
+    """アップロード画像がサイズ上限を超えたことを表す例外。"""
+
+
+# 画像保存時の os.open フラグ（Windows では O_BINARY を付与する）。
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# 画像をストリームからコピーする際の読み込み単位（256 KiB）。
+_COPY_CHUNK_BYTES = 256 * 1024
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """os.write の部分書き込みを考慮して全量を書き込む。"""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _copy_stream_to_file(
+    src: BinaryIO, path: Path, max_bytes: Optional[int] = None
+) -> int:
+    """ストリームをチャンク単位でファイルへ書き込み、書き込んだバイト数を返す。
+
+    主要変数:
+        total: これまでに書き込んだバイト数。
+
+    Note:
+        - Path.write_bytes の BufferedWriter を介さず os.write で直接書き込む。
+        - 全量をメモリに載せないため、ピークメモリはチャンクサイズに収まる。
+        - max_bytes を超えた時点で ScanImageTooLargeError、空の場合は
+          EmptyScanImageError を送出し、書きかけのファイルは削除する。
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    total = 0
+    try:
+        while chunk := src.read(_COPY_CHUNK_BYTES):
+            total += len(chunk)
+            if max_bytes is not None and total > max_bytes:
+                raise ScanImageTooLargeError(max_bytes)
+            _write_all(fd, chunk)
+        if total == 0:
+            raise EmptyScanImageError()
+    except BaseException:
+        os.close(fd)
+        path.unlink(missing_ok=True)
+        raise
+    os.close(fd)
+    return total
+
+
+# 画像読み込み時の os.open フラグ。
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
+def _read_file_bytes(path: str, size: int) -> bytes:
+    """保存時に記録したサイズ分のバイト列をファイルから読み込む。
+
+    Note:
+        - Path.read_bytes の BufferedReader 構築・fstat を省き、
+          既知サイズで os.read する（通常は1回の read で完了する）。
+        - 部分読み込み時は size に達するか EOF まで読み進める。
+    """
+    fd = os.open(path, _READ_FLAGS)
+    try:
+        data = os.read(fd, size)
+        if len(data) >= size:
+            return data
+        chunks = [data]
+        remaining = size - len(data)
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+# レコード辞書とロックを分割するシャード数。
+_SHARD_COUNT = 16
+
 
 class InMemoryScanStore:
-    """スキャン情報を管理するインメモリストア。"""
+    """スキャン情報を管理するインメモリストア。
+
+    Note:
+        - レコードは scan_id のハッシュで _SHARD_COUNT 個のシャードへ分散し、
+          更新時はそのシャードのロックのみを取得する（同時アップロード時の競合緩和）。
+        - 参照（get_scan）はロックを取らない。CPython の dict.get はアトミックである。
+    """
 
     def __init__(self, image_dir: Path) -> None:
         """ストアを初期化する。
@@ -58,8 +219,14 @@ class InMemoryScanStore:
         """
         self._image_dir = image_dir
         self._image_dir.mkdir(parents=True, exist_ok=True)
-        self._records: dict[str, ScanRecord] = {}
-        self._lock = Lock()
+        # (scan_id -> ScanRecord の辞書, その辞書を保護するロック) の配列。
+        self._shards: list[tuple[dict[str, ScanRecord], Lock]] = [
+            ({}, Lock()) for _ in range(_SHARD_COUNT)
+        ]
+
+    def _shard(self, scan_id: str) -> tuple[dict[str, ScanRecord], Lock]:
+        """scan_id が属するシャード（レコード辞書, ロック）を返す。"""
+        return self._shards[hash(scan_id) % _SHARD_COUNT]
 
     def create_scan(
         self,
@@ -68,39 +235,51 @@ class InMemoryScanStore:
         device_id: Optional[str],
         filename: str,
         content_type: str,
-        image_bytes: bytes,
+        image: BinaryIO,
+        max_bytes: Optional[int] = None,
     ) -> ScanRecord:
-        """画像を保存し、ScanRecord を生成して保持する。"""
+        """画像ストリームを保存し、ScanRecord を生成して保持する。
+
+        Note:
+            - image は UploadFile.file などの読み込み可能なバイナリストリーム。
+            - 空の場合は EmptyScanImageError、max_bytes 超過時は
+              ScanImageTooLargeError を送出し、レコードは作成しない。
+        """
         suffix = Path(filename or "").suffix
         safe_suffix = suffix if 0 < len(suffix) <= 10 else ".bin"
-        scan_id = str(uuid4())
+        scan_id = _next_scan_id()
         image_path = self._image_dir / f"{scan_id}{safe_suffix}"
 
-        image_path.write_bytes(image_bytes)
+        size_bytes = _copy_stream_to_file(image, image_path, max_bytes)
         record = ScanRecord(
             scan_id=scan_id,
             store_id=store_id,
             device_id=device_id,
             image_uri=str(image_path.resolve()),
             content_type=content_type,
-            size_bytes=len(image_bytes),
-            created_at=datetime.now(timezone.utc),
+            size_bytes=size_bytes,
+            created_at=time.time_ns(),
         )
-        with self._lock:
-            self._records[scan_id] = record
+        records, lock = self._shard(scan_id)
+        with lock:
+            records[scan_id] = record
         return record
 
     def get_scan(self, scan_id: str) -> Optional[ScanRecord]:
         """scan_id に対応するレコードを返す。存在しない場合は None。"""
-        with self._lock:
-            return self._records.get(scan_id)
+        records, _ = self._shard(scan_id)
+        return records.get(scan_id)
 
     def load_image_bytes(self, scan_id: str) -> bytes:
-        """保存済み画像のバイト列を返す。"""
+        """保存済み画像のバイト列を返す。
+
+        Note:
+            - 読み込みサイズは record.size_bytes（保存時のサイズ）を用いる。
+        """
         record = self.get_scan(scan_id)
         if record is None:
             raise KeyError(scan_id)
-        return Path(record.image_uri).read_bytes()
+        return _read_file_bytes(record.image_uri, record.size_bytes)
 
     def save_detections(
         self,
@@ -110,22 +289,24 @@ class InMemoryScanStore:
         model_version: str,
     ) -> ScanRecord:
         """推論結果をレコードに保存する。"""
-        with self._lock:
-            record = self._records.get(scan_id)
+        records, lock = self._shard(scan_id)
+        with lock:
+            record = records.get(scan_id)
             if record is None:
                 raise KeyError(scan_id)
             record.detections = detections
             record.model_version = model_version
-            self._records[scan_id] = record
             return record
 
 
-_SCAN_STORE: Optional[InMemoryScanStore] = None
-
-
+@lru_cache(maxsize=1)
 def get_scan_store() -> InMemoryScanStore:
-    """スキャンストアのシングルトンを返す。"""
-    global _SCAN_STORE
-    if _SCAN_STORE is None:
-        _SCAN_STORE = InMemoryScanStore(image_dir=Path("storage/images"))
-    return _SCAN_STORE
+    """スキャンストアのシングルトンを返す。
+
+    Note:
+        - 初回呼び出し時に SCAN_IMAGE_DIR（既定: storage/images）で生成する。
+        - lru_cache により初期化は1回だけ行われる。
+          差し替え時は get_scan_store.cache_clear() を呼ぶ。
+    """
+    image_dir = os.getenv("SCAN_IMAGE_DIR") or "storage/images"
+    return InMemoryScanStore(image_dir=Path(image_dir))
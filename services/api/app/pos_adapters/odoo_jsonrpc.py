@@ -7,11 +7,17 @@
 - Odoo Web JSON-RPC クライアント
   - /web/session/authenticate
   - /web/dataset/call_kw
+  - OdooConfig 単位で共有する HTTP/2 コネクションプール
+  - httpx.AsyncClient を用いた非同期版（AsyncOdooJsonRpcClient）
+  - 認証セッション（uid + cookie）のプロセス内共有と期限切れ時の再認証
 - 受注（sale.order）
   - 下書き作成（sale.order.create）
   - 確定（sale.order.action_confirm）
+  - 作成と確定の1回化（scancheckout_sale アドオン導入時、任意）
 - POS 注文（pos.order）
   - sync_from_ui（Odoo 19 系）
+- SKU 解決結果のプロセス内キャッシュ（TTL + LRU）
+- async ルート向けの非同期メソッド（acheckout など a* 接頭辞）
 
 注意
 - POS の sync_from_ui に渡す payload は Odoo バージョンや導入モジュールで変わります。
@@ -22,11 +28,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
+from operator import itemgetter
+from threading import Lock
 from typing import Any, Optional, Protocol, Sequence
 from uuid import uuid4
 
 import httpx
+import orjson
+
+# モジュールロガー。メッセージは %-形式の遅延フォーマットで渡す。
+logger = logging.getLogger(__name__)
 
 
 # ============================================================
@@ -34,7 +53,7 @@ import httpx
 # ============================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CheckoutLine:
     """チェックアウト明細の1行を表す入力モデル。"""
 
@@ -46,7 +65,7 @@ class CheckoutLine:
     price_unit: Optional[float] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CheckoutRequest:
     """API 層からアダプタ層へ渡すチェックアウト要求。"""
 
@@ -60,7 +79,7 @@ class CheckoutRequest:
     note: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CheckoutResult:
     """アダプタ層から API 層へ返す共通結果モデル。"""
 
@@ -83,6 +102,10 @@ class PosAdapter(Protocol):
         """チェックアウト要求を処理し、結果を返す。"""
         ...
 
+    async def acheckout(self, req: CheckoutRequest) -> CheckoutResult:
+        """checkout の非同期版。"""
+        ...
+
 
 # ============================================================
 # Odoo JSON-RPC クライアント
@@ -109,75 +132,337 @@ class OdooConfig:
     default_partner_id: int = 1  # 例: 店内客（共通顧客）
     # 未指定時は Odoo 既定価格表に委譲。
     default_pricelist_id: Optional[int] = None
+    # True の場合、作成と確定を scancheckout_sale アドオンの
+    # sale.order.create_and_confirm で1回の RPC にまとめる。
+    sale_create_and_confirm: bool = False
 
     # POS 用の既定値（sync_from_ui のみ）
     # mode="pos" でセッションID未指定時に使う値。
     default_pos_session_id: Optional[int] = None
     # sync_from_ui 呼び出し時に draft フラグへ反映する値。
     create_pos_draft: bool = True
+    # POS セッションの検証結果（書き込み可能）を再利用する秒数。0 以下で毎回検証。
+    # 有効にすると TTL 内に closing_control/closed となったセッションを拒否できない。
+    pos_session_check_ttl_sec: float = 0.0
 
     # SKU の参照フィールド（default_code / barcode など）
     # SKU と Odoo 商品を突合する際のキー列。
     sku_field: str = "default_code"
 
+    # SKU 解決結果キャッシュ
+    # キャッシュする SKU の最大件数。0 以下でキャッシュ無効。
+    sku_cache_max_size: int = 4096
+    # キャッシュの有効秒数。0 以下でキャッシュ無効。
+    sku_cache_ttl_sec: float = 300.0
+
 
 class OdooJsonRpcError(RuntimeError):
     """Odoo JSON-RPC からのエラーを表す例外。"""
 
 
+# OdooConfig -> 共有 httpx.Client。アダプタを要求ごとに生成しても接続を再利用する。
+_HTTP_CLIENTS: dict[OdooConfig, httpx.Client] = {}
+# OdooConfig -> 共有 httpx.AsyncClient（async 経路用）。
+_ASYNC_HTTP_CLIENTS: dict[OdooConfig, httpx.AsyncClient] = {}
+# _HTTP_CLIENTS / _ASYNC_HTTP_CLIENTS を保護するロック。
+_HTTP_CLIENTS_LOCK = Lock()
+# 共有クライアントのコネクションプール上限。
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+
+def _get_pooled_http_client(cfg: OdooConfig) -> httpx.Client:
+    """cfg に対応する共有 httpx.Client を返す（未生成なら生成する）。
+
+    Note:
+        - HTTP/2 を有効化し、同一接続上で call_kw を多重化する。
+    """
+    with _HTTP_CLIENTS_LOCK:
+        client = _HTTP_CLIENTS.get(cfg)
+        if client is None or client.is_closed:
+            client = httpx.Client(
+                base_url=cfg.base_url,
+                http2=True,
+                limits=_HTTP_LIMITS,
+                timeout=cfg.timeout_sec,
+            )
+            _HTTP_CLIENTS[cfg] = client
+        return client
+
+
+def _get_pooled_async_http_client(cfg: OdooConfig) -> httpx.AsyncClient:
+    """cfg に対応する共有 httpx.AsyncClient を返す（未生成なら生成する）。
+
+    Note:
+        - 設定は _get_pooled_http_client と同一（HTTP/2 + コネクションプール）。
+    """
+    with _HTTP_CLIENTS_LOCK:
+        client = _ASYNC_HTTP_CLIENTS.get(cfg)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=cfg.base_url,
+                http2=True,
+                limits=_HTTP_LIMITS,
+                timeout=cfg.timeout_sec,
+            )
+            _ASYNC_HTTP_CLIENTS[cfg] = client
+        return client
+
+
+def close_pooled_http_clients() -> None:
+    """共有している httpx.Client をすべてクローズする。
+
+    Note:
+        - FastAPI の shutdown（lifespan 終了）時に呼び出す。
+    """
+    with _HTTP_CLIENTS_LOCK:
+        clients = list(_HTTP_CLIENTS.values())
+        _HTTP_CLIENTS.clear()
+    for client in clients:
+        client.close()
+
+
+async def aclose_pooled_http_clients() -> None:
+    """共有している httpx.AsyncClient をすべてクローズする。
+
+    Note:
+        - FastAPI の shutdown（lifespan 終了）時に await する。
+    """
+    with _HTTP_CLIENTS_LOCK:
+        clients = list(_ASYNC_HTTP_CLIENTS.values())
+        _ASYNC_HTTP_CLIENTS.clear()
+    for client in clients:
+        await client.aclose()
+
+
+# Odoo がセッション期限切れ時に返す JSON-RPC エラーコード。
+_SESSION_EXPIRED_CODE = 100
+
+
+class _SessionCache:
+    """認証済みセッション（uid + cookie）をプロセス内で共有するキャッシュ。
+
+    Note:
+        - キーは (base_url, db, username)。クライアントを作り直しても
+          /web/session/authenticate の往復を省略できる。
+        - セッション期限切れを検知した場合は invalidate() で破棄する。
+    """
+
+    def __init__(self) -> None:
+        """空のキャッシュを生成する。
+
+        主要変数:
+            _entries: (base_url, db, username) -> (uid, cookie 辞書)。
+            _lock: スレッド間で _entries の読み書きを直列化するロック。
+        """
+        # (base_url, db, username) -> (uid, cookie 辞書)。
+        self._entries: dict[tuple[str, str, str], tuple[int, dict[str, str]]] = {}
+        # _entries を保護するロック。
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(cfg: OdooConfig) -> tuple[str, str, str]:
+        """cfg からキャッシュキーを返す。"""
+        return (cfg.base_url, cfg.db, cfg.username)
+
+    def get(self, cfg: OdooConfig) -> Optional[tuple[int, dict[str, str]]]:
+        """キャッシュ済みの (uid, cookie) を返す。未登録なら None。"""
+        with self._lock:
+            return self._entries.get(self._key(cfg))
+
+    def store(self, cfg: OdooConfig, uid: int, cookies: dict[str, str]) -> None:
+        """認証結果を登録する。"""
+        with self._lock:
+            self._entries[self._key(cfg)] = (uid, dict(cookies))
+
+    def invalidate(self, cfg: OdooConfig) -> None:
+        """cfg に対応するセッションを破棄する。"""
+        with self._lock:
+            self._entries.pop(self._key(cfg), None)
+
+    def clear(self) -> None:
+        """すべてのセッションを破棄する。"""
+        with self._lock:
+            self._entries.clear()
+
+
+# プロセス内で共有する認証セッションキャッシュ。
+_SESSION_CACHE = _SessionCache()
+
+
+def _is_session_expired(data: dict[str, Any]) -> bool:
+    """JSON-RPC 応答がセッション期限切れエラーかを判定する。"""
+    error = data.get("error")
+    return isinstance(error, dict) and error.get("code") == _SESSION_EXPIRED_CODE
+
+
+# orjson でシリアライズした body を送る際のヘッダ。
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+# JSON-RPC エンベロープの定数部分（params の直前まで）。
+# 末尾に orjson.dumps(params) と b"}" を連結して body を組み立てる。
+_AUTHENTICATE_PREFIX = b'{"jsonrpc":"2.0","method":"call","id":1,"params":'
+_CALL_KW_PREFIX = b'{"jsonrpc":"2.0","method":"call","id":2,"params":'
+
+
+def _authenticate_body(cfg: OdooConfig) -> bytes:
+    """/web/session/authenticate 用の JSON-RPC body（シリアライズ済み）を返す。"""
+    params = {"db": cfg.db, "login": cfg.username, "password": cfg.password}
+    return _AUTHENTICATE_PREFIX + orjson.dumps(params) + b"}"
+
+
+def _call_kw_body(
+    model: str,
+    method: str,
+    args: Sequence[Any] | None,
+    kwargs: dict[str, Any] | None,
+) -> bytes:
+    """/web/dataset/call_kw 用の JSON-RPC body（シリアライズ済み）を返す。
+
+    Note:
+        - 定数部分は _CALL_KW_PREFIX を再利用し、params のみをシリアライズする。
+    """
+    params = {
+        "model": model,
+        "method": method,
+        "args": list(args or []),
+        "kwargs": kwargs or {},
+    }
+    return _CALL_KW_PREFIX + orjson.dumps(params) + b"}"
+
+
+def _parse_authenticate_response(data: dict[str, Any]) -> int:
+    """authenticate の返却 JSON から uid を取り出す。
+
+    Note:
+        - error を含む場合や uid が取れない場合は OdooJsonRpcError を送出する。
+    """
+    # Odoo から明示エラーが返った場合は専用例外へ変換。
+    if data.get("error"):
+        raise OdooJsonRpcError(f"authenticate error: {data['error']}")
+
+    # 成功時の result を取り出し、uid を取得する。
+    result = data.get("result") or {}
+    uid = result.get("uid")
+    if not uid:
+        raise OdooJsonRpcError(f"authenticate failed: {data}")
+    return int(uid)
+
+
+def _parse_call_kw_response(data: dict[str, Any]) -> Any:
+    """call_kw の返却 JSON から result を取り出す。
+
+    Note:
+        - error を含む場合は OdooJsonRpcError を送出する。
+    """
+    # Odoo 側エラーをアプリ例外へ変換。
+    if data.get("error"):
+        raise OdooJsonRpcError(f"call_kw error: {data['error']}")
+
+    # 正常時の result をそのまま返す。
+    return data.get("result")
+
+
 class OdooJsonRpcClient:
     """Odoo Web(JSON-RPC) エンドポイントを叩く薄いラッパ。
 
     Note:
         - 認証後の cookie セッションを httpx.Client 内で維持する。
         - XML-RPC ではなく Web クライアント互換の JSON-RPC を利用する。
+        - http_client 未指定時は OdooConfig 単位の共有クライアントを利用する。
+        - リクエスト/レスポンスの JSON 変換は orjson で行う。
     """
 
-    def __init__(self, cfg: OdooConfig) -> None:
+    def __init__(
+        self, cfg: OdooConfig, http_client: Optional[httpx.Client] = None
+    ) -> None:
         # 接続設定を保持する。
         self.cfg = cfg
-        # keep-alive/cookie を再利用する HTTP クライアント。
-        self._client = httpx.Client(base_url=cfg.base_url, timeout=cfg.timeout_sec)
+        # 注入された HTTP クライアント（None なら呼び出し時に共有プールを引く）。
+        self._http_client = http_client
         # authenticate 後に確定する Odoo ユーザーID。
         self._uid: Optional[int] = None
+        # 現在のセッション cookie を保持しているクライアント。
+        self._session_client: Optional[httpx.Client] = None
+        # セッションを確立・引き継ぐたびに進める世代番号（期限切れ時の再認証判定用）。
+        self._session_gen = 0
+        # 複数スレッドからの同時認証を1回にまとめるロック。
+        self._auth_lock = Lock()
+
+    @property
+    def _client(self) -> httpx.Client:
+        """keep-alive/cookie を再利用する HTTP クライアント（注入 or 共有プール）。
+
+        Note:
+            - 共有プールは呼び出しごとに引き直す。lifespan 終了で閉じられた後も
+              （同一プロセスで2つ目のアプリを起動した場合など）新しい
+              クライアントで動作を継続する。
+        """
+        return self._http_client or _get_pooled_http_client(self.cfg)
 
     def close(self) -> None:
-        """保持している HTTP コネクションをクローズする。"""
-        self._client.close()
+        """このインスタンスの認証状態を破棄する。
+
+        Note:
+            - 共有クライアントや注入されたクライアントは他インスタンスと共用のため
+              ここでは閉じない。共有分は close_pooled_http_clients() で閉じる。
+        """
+        self._uid = None
 
     def authenticate(self) -> int:
-        """/web/session/authenticate で認証し、セッション cookie を確立する。"""
-        # Odoo Web JSON-RPC の認証ペイロード。
-        payload = {
-            "jsonrpc": "2.0",
-            "method": "call",
-            "params": {
-                "db": self.cfg.db,
-                "login": self.cfg.username,
-                "password": self.cfg.password,
-            },
-            "id": 1,
-        }
+        """/web/session/authenticate で認証し、セッション cookie を確立する。
+
+        Note:
+            - 認証結果（uid + cookie）は _SESSION_CACHE へ登録する。
+        """
         # 認証 API 呼び出し。HTTP エラーは raise_for_status で例外化。
-        res = self._client.post("/web/session/authenticate", json=payload)
+        client = self._client
+        res = client.post(
+            "/web/session/authenticate",
+            content=_authenticate_body(self.cfg),
+            headers=_JSON_HEADERS,
+        )
         res.raise_for_status()
-        # 返却 JSON 全体（error/result のどちらかを持つ）。
-        data = res.json()
-
-        # Odoo から明示エラーが返った場合は専用例外へ変換。
-        if data.get("error"):
-            raise OdooJsonRpcError(f"authenticate error: {data['error']}")
-
-        # 成功時の result を取り出し、uid を取得する。
-        result = data.get("result") or {}
-        uid = result.get("uid")
-        if not uid:
-            raise OdooJsonRpcError(f"authenticate failed: {data}")
 
         # 以降の call_kw で利用できるよう保持する。
-        self._uid = int(uid)
+        self._uid = _parse_authenticate_response(orjson.loads(res.content))
+        self._session_client = client
+        self._session_gen += 1
+        _SESSION_CACHE.store(self.cfg, self._uid, dict(client.cookies))
         return self._uid
 
+    def _ensure_session(self) -> None:
+        """セッションを確立する（キャッシュがあれば認証を省略する）。
+
+        Note:
+            - 認証済みならロックを取らずに戻る。未認証時は _auth_lock 内で
+              再確認し、並行呼び出しでも authenticate は1回だけ行う。
+            - 共有クライアントが作り直された場合は cookie を引き継ぎ直す。
+        """
+        client = self._client
+        if self._uid is not None and self._session_client is client:
+            return
+        with self._auth_lock:
+            if self._uid is not None and self._session_client is client:
+                return
+            cached = _SESSION_CACHE.get(self.cfg)
+            if cached is None:
+                self.authenticate()
+                return
+            # 他インスタンスが確立したセッション cookie を引き継ぐ。
+            self._uid, cookies = cached
+            client.cookies.update(cookies)
+            self._session_client = client
+            self._session_gen += 1
+
+    def _post_call_kw(self, body: bytes) -> dict[str, Any]:
+        """call_kw API を呼び出し、返却 JSON を返す。"""
+        res = self._client.post(
+            "/web/dataset/call_kw", content=body, headers=_JSON_HEADERS
+        )
+        res.raise_for_status()
+        return orjson.loads(res.content)
+
     def call_kw(
         self,
         model: str,
@@ -185,47 +470,167 @@ class OdooJsonRpcClient:
         args: Sequence[Any] | None = None,
         kwargs: dict[str, Any] | None = None,
     ) -> Any:
-        """/web/dataset/call_kw 経由で任意モデルメソッドを呼び出す。"""
+        """/web/dataset/call_kw 経由で任意モデルメソッドを呼び出す。
+
+        Note:
+            - セッション期限切れ（error.code == 100）の場合は1回だけ再認証して
+              再実行する。再実行でも失敗した場合は OdooJsonRpcError を送出する。
+            - 送信時のセッション世代を控え、ロック取得時点で他スレッドが既に
+              再認証していれば認証を省略して再実行のみ行う。
+        """
         # 未認証なら先に認証し、セッションを確立する。
-        if self._uid is None:
-            self.authenticate()
-
-        # Odoo Web JSON-RPC の標準 payload。
-        payload = {
-            "jsonrpc": "2.0",
-            "method": "call",
-            "params": {
-                "model": model,
-                "method": method,
-                "args": list(args or []),
-                "kwargs": kwargs or {},
-            },
-            "id": 2,
-        }
-        # call_kw API 呼び出し。
-        res = self._client.post("/web/dataset/call_kw", json=payload)
+        self._ensure_session()
+
+        body = _call_kw_body(model, method, args, kwargs)
+        # POST に使うセッションの世代（cookie 更新後に進むため送信前に読む）。
+        sent_gen = self._session_gen
+        data = self._post_call_kw(body)
+        if _is_session_expired(data):
+            with self._auth_lock:
+                if self._session_gen == sent_gen:
+                    _SESSION_CACHE.invalidate(self.cfg)
+                    self.authenticate()
+            data = self._post_call_kw(body)
+        return _parse_call_kw_response(data)
+
+
+class AsyncOdooJsonRpcClient:
+    """OdooJsonRpcClient の非同期版（httpx.AsyncClient 利用）。
+
+    Note:
+        - async def ルートから呼んでもイベントループをブロックしない。
+        - http_client 未指定時は OdooConfig 単位の共有クライアントを利用する。
+    """
+
+    def __init__(
+        self, cfg: OdooConfig, http_client: Optional[httpx.AsyncClient] = None
+    ) -> None:
+        """クライアントを生成する（認証は初回 call_kw まで遅延する）。
+
+        主要変数:
+            cfg: 接続先・認証情報を持つ OdooConfig。
+            http_client: 注入する httpx.AsyncClient。None の場合は _client 参照の
+                たびに _get_pooled_async_http_client(cfg) で共有プールから引き、
+                閉じられていれば作り直したクライアントを使う。
+        """
+        # 接続設定を保持する。
+        self.cfg = cfg
+        # 注入された非同期 HTTP クライアント（None なら呼び出し時に共有プールを引く）。
+        self._http_client = http_client
+        # authenticate 後に確定する Odoo ユーザーID。
+        self._uid: Optional[int] = None
+        # 現在のセッション cookie を保持しているクライアント。
+        self._session_client: Optional[httpx.AsyncClient] = None
+        # セッションの世代番号（同期版と同じ用途）。
+        self._session_gen = 0
+        # asyncio.gather 等による同時認証を1回にまとめるロック。
+        self._auth_lock = asyncio.Lock()
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """非同期 HTTP クライアント（注入 or 共有プール。同期版と同じく都度引く）。"""
+        return self._http_client or _get_pooled_async_http_client(self.cfg)
+
+    async def authenticate(self) -> int:
+        """/web/session/authenticate で認証し、セッション cookie を確立する。"""
+        client = self._client
+        res = await client.post(
+            "/web/session/authenticate",
+            content=_authenticate_body(self.cfg),
+            headers=_JSON_HEADERS,
+        )
         res.raise_for_status()
-        # 返却 JSON を解析する。
-        data = res.json()
+        self._uid = _parse_authenticate_response(orjson.loads(res.content))
+        self._session_client = client
+        self._session_gen += 1
+        _SESSION_CACHE.store(self.cfg, self._uid, dict(client.cookies))
+        return self._uid
 
-        # Odoo 側エラーをアプリ例外へ変換。
-        if data.get("error"):
-            raise OdooJsonRpcError(f"call_kw error: {data['error']}")
+    async def _ensure_session(self) -> None:
+        """セッションを確立する（キャッシュがあれば認証を省略する）。"""
+        client = self._client
+        if self._uid is not None and self._session_client is client:
+            return
+        async with self._auth_lock:
+            if self._uid is not None and self._session_client is client:
+                return
+            cached = _SESSION_CACHE.get(self.cfg)
+            if cached is None:
+                await self.authenticate()
+                return
+            self._uid, cookies = cached
+            client.cookies.update(cookies)
+            self._session_client = client
+            self._session_gen += 1
+
+    async def _post_call_kw(self, body: bytes) -> dict[str, Any]:
+        """call_kw API を呼び出し、返却 JSON を返す。"""
+        res = await self._client.post(
+            "/web/dataset/call_kw", content=body, headers=_JSON_HEADERS
+        )
+        res.raise_for_status()
+        return orjson.loads(res.content)
 
-        # 正常時の result をそのまま返す。
-        return data.get("result")
+    async def call_kw(
+        self,
+        model: str,
+        method: str,
+        args: Sequence[Any] | None = None,
+        kwargs: dict[str, Any] | None = None,
+    ) -> Any:
+        """/web/dataset/call_kw 経由で任意モデルメソッドを呼び出す。
+
+        Note:
+            - セッション期限切れ時の再認証は同期版と同じく1回のみ。
+              並行して期限切れを検知しても、再認証は最初の1件だけが行う。
+        """
+        await self._ensure_session()
+
+        body = _call_kw_body(model, method, args, kwargs)
+        sent_gen = self._session_gen
+        data = await self._post_call_kw(body)
+        if _is_session_expired(data):
+            async with self._auth_lock:
+                if self._session_gen == sent_gen:
+                    _SESSION_CACHE.invalidate(self.cfg)
+                    await self.authenticate()
+            data = await self._post_call_kw(body)
+        return _parse_call_kw_response(data)
 
 
 # ============================================================
 # Odoo 実装（sale.order / pos.order）
 # ============================================================
 
+# この件数を超える SKU 解決は分割して並行に search_read する。
+_PARALLEL_SKU_THRESHOLD = 128
+# 分割時の1チャンクあたりの目安件数。
+_SKU_CHUNK_SIZE = 64
+# 並行 search_read の最大数。
+_MAX_SKU_WORKERS = 8
+
+
+def _split_skus(skus: list[str]) -> list[list[str]]:
+    """SKU 一覧を並行 search_read 用のチャンクへ分割する。
+
+    主要変数:
+        n_chunks: チャンク数（最大 _MAX_SKU_WORKERS）。
+        size: 1チャンクあたりの件数。
+    """
+    n_chunks = min(_MAX_SKU_WORKERS, math.ceil(len(skus) / _SKU_CHUNK_SIZE))
+    size = math.ceil(len(skus) / n_chunks)
+    return [skus[i : i + size] for i in range(0, len(skus), size)]
+
 
 class OdooPosAdapter(PosAdapter):
     """Odoo 連携の POS アダプタ。
 
     routes 層からは本クラスの公開メソッドのみを利用し、
     Odoo モデル名や payload 形式の詳細を隠蔽する。
+
+    Note:
+        - SKU 解決結果は (sku_field, sku) 単位で TTL 付き LRU キャッシュに保持する。
+        - FastAPI のワーカースレッド間で共有されても良いよう Lock で保護する。
     """
 
     def __init__(self, cfg: OdooConfig) -> None:
@@ -233,11 +638,129 @@ class OdooPosAdapter(PosAdapter):
         self.cfg = cfg
         # Odoo との実通信を担当する JSON-RPC クライアント。
         self.client = OdooJsonRpcClient(cfg)
+        # async 経路（a* メソッド）で使う非同期 JSON-RPC クライアント。
+        self.aclient = AsyncOdooJsonRpcClient(cfg)
+        # (sku_field, sku) -> (有効期限[monotonic 秒], 商品情報) の LRU キャッシュ。
+        self._sku_cache: OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        # _sku_cache を保護するロック。
+        self._sku_cache_lock = Lock()
+        # 検証済み POS セッションID -> 有効期限[monotonic 秒]。
+        self._pos_session_checked: dict[int, float] = {}
 
     # -------------------------
     # 共通ユーティリティ
     # -------------------------
 
+    def _lookup_sku_cache(
+        self, skus: list[str], with_price: bool = True
+    ) -> tuple[dict[str, dict[str, Any]], list[str]]:
+        """SKU 一覧をキャッシュヒット分とミス分に振り分ける。
+
+        主要変数:
+            hits: キャッシュから解決できた {sku: 商品情報}。
+            misses: Odoo へ問い合わせが必要な SKU 一覧。
+
+        Note:
+            - 期限切れのエントリは参照時に破棄し、ミスとして扱う。
+            - 同一 SKU が複数行に現れても1件として扱う（misses は重複しない）。
+            - with_price=True の場合、ID のみのエントリ（lst_price なし）はミスとする。
+        """
+        field = self.cfg.sku_field
+        now = time.monotonic()
+        hits: dict[str, dict[str, Any]] = {}
+        misses: list[str] = []
+        with self._sku_cache_lock:
+            for sku in dict.fromkeys(skus):
+                key = (field, sku)
+                entry = self._sku_cache.get(key)
+                if entry is None:
+                    misses.append(sku)
+                    continue
+                expires_at, product = entry
+                if expires_at <= now:
+                    del self._sku_cache[key]
+                    misses.append(sku)
+                    continue
+                if with_price and "lst_price" not in product:
+                    misses.append(sku)
+                    continue
+                # LRU 順序を更新する。
+                self._sku_cache.move_to_end(key)
+                hits[sku] = product
+        return hits, misses
+
+    def _store_sku_cache(self, products: dict[str, dict[str, Any]]) -> None:
+        """解決済みの商品情報をキャッシュへ登録する。
+
+        Note:
+            - 最大件数を超えた場合は最も古く参照されたエントリから破棄する。
+            - cfg.sku_cache_max_size / cfg.sku_cache_ttl_sec が 0 以下なら何もしない。
+        """
+        max_size = self.cfg.sku_cache_max_size
+        ttl_sec = self.cfg.sku_cache_ttl_sec
+        if max_size <= 0 or ttl_sec <= 0 or not products:
+            return
+
+        field = self.cfg.sku_field
+        expires_at = time.monotonic() + ttl_sec
+        with self._sku_cache_lock:
+            for sku, product in products.items():
+                key = (field, sku)
+                self._sku_cache[key] = (expires_at, product)
+                self._sku_cache.move_to_end(key)
+            while len(self._sku_cache) > max_size:
+                self._sku_cache.popitem(last=False)
+
+    def invalidate_sku(self, sku: str) -> None:
+        """指定 SKU のキャッシュを破棄する（商品マスタ更新時などに利用）。"""
+        with self._sku_cache_lock:
+            self._sku_cache.pop((self.cfg.sku_field, sku), None)
+
+    def _product_search_args(
+        self, skus: list[str], with_price: bool = True
+    ) -> dict[str, Any]:
+        """product.product.search_read に渡す args/kwargs を返す。
+
+        Note:
+            - with_price=False の場合は ["id", sku_field] のみを要求する。
+        """
+        field = self.cfg.sku_field
+        fields = ["id", field, "name", "lst_price"] if with_price else ["id", field]
+        return {
+            "args": [[[field, "in", skus]], fields],
+            "kwargs": {"limit": max(1, len(skus))},
+        }
+
+    def _parse_product_rows(
+        self, rows: list[dict[str, Any]], with_price: bool = True
+    ) -> dict[str, dict[str, Any]]:
+        """search_read の結果行を {sku: 商品情報} へ変換し、キャッシュへ登録する。
+
+        Note:
+            - search_read は要求した fields を必ず返すため、itemgetter で一括取得する。
+            - sku_field が未設定（False）の行は除外する。
+            - with_price=False の場合、商品情報は {"id": ...} のみとなる。
+            - id / lst_price の型変換はこの境界でのみ行い、下流では再変換しない。
+        """
+        if with_price:
+            get = itemgetter(self.cfg.sku_field, "id", "name", "lst_price")
+            fetched: dict[str, dict[str, Any]] = {
+                str(key): {
+                    "id": int(pid),
+                    "name": name,
+                    "lst_price": float(lst_price or 0.0),
+                }
+                for key, pid, name, lst_price in map(get, rows)
+                if key
+            }
+        else:
+            get = itemgetter(self.cfg.sku_field, "id")
+            fetched = {str(key): {"id": int(pid)} for key, pid in map(get, rows) if key}
+        self._store_sku_cache(fetched)
+        return fetched
+
     def resolve_products_by_sku(self, skus: list[str]) -> dict[str, dict[str, Any]]:
         """SKU をキーに商品情報を解決する。
 
@@ -253,28 +776,50 @@ class OdooPosAdapter(PosAdapter):
         Note:
             - sku_field は cfg.sku_field（default_code / barcode など）で切り替える。
             - lst_price は明細で単価未指定時のフォールバックとして使う。
+            - キャッシュヒットした SKU は Odoo へ問い合わせない。
+            - Odoo に存在しなかった SKU はキャッシュしない。
         """
-        field = self.cfg.sku_field
-        rows = self.client.call_kw(
+        return self._resolve_products(skus, with_price=True)
+
+    def _resolve_products(
+        self, skus: list[str], with_price: bool
+    ) -> dict[str, dict[str, Any]]:
+        """キャッシュミス分のみ search_read し、{sku: 商品情報} を返す。"""
+        out, misses = self._lookup_sku_cache(skus, with_price)
+        if not misses:
+            return out
+
+        rows = self._search_products(misses, with_price)
+        out.update(self._parse_product_rows(rows, with_price))
+        logger.debug("SKU 解決: 問い合わせ %d 件 / 取得 %d 件", len(misses), len(rows))
+        return out
+
+    def _search_products_chunk(
+        self, skus: list[str], with_price: bool = True
+    ) -> list[dict[str, Any]]:
+        """1回の product.product.search_read で SKU を検索する。"""
+        return self.client.call_kw(
             model="product.product",
             method="search_read",
-            args=[
-                [[field, "in", skus]],
-                ["id", field, "name", "lst_price"],
-            ],
-            kwargs={"limit": max(1, len(skus))},
+            **self._product_search_args(skus, with_price),
         ) or []
 
-        out: dict[str, dict[str, Any]] = {}
-        for row in rows:
-            key = row.get(field)
-            if key:
-                out[str(key)] = {
-                    "id": int(row["id"]),
-                    "name": row.get("name"),
-                    "lst_price": float(row.get("lst_price") or 0.0),
-                }
-        return out
+    def _search_products(
+        self, skus: list[str], with_price: bool = True
+    ) -> list[dict[str, Any]]:
+        """SKU 一覧を search_read し、結果行を返す。
+
+        Note:
+            - _PARALLEL_SKU_THRESHOLD 件を超える場合はチャンクに分割し、
+              ThreadPoolExecutor で並行に問い合わせる（大きな in 句を避ける）。
+        """
+        if len(skus) <= _PARALLEL_SKU_THRESHOLD:
+            return self._search_products_chunk(skus, with_price)
+
+        chunks = _split_skus(skus)
+        search = partial(self._search_products_chunk, with_price=with_price)
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            return [row for rows in executor.map(search, chunks) for row in rows]
 
     def resolve_product_ids_by_sku(self, skus: list[str]) -> dict[str, int]:
         """SKU -> product.product.id を解決する。
@@ -282,25 +827,42 @@ class OdooPosAdapter(PosAdapter):
         Note:
             - cfg.sku_field により照合列を切り替え可能。
             - 戻り値は {sku文字列: product_id} のマッピング。
+            - search_read は ["id", sku_field] のみを要求する（name/lst_price 不要）。
         """
-        products = self.resolve_products_by_sku(skus)
-        return {sku: int(data["id"]) for sku, data in products.items()}
+        products = self._resolve_products(skus, with_price=False)
+        return {sku: data["id"] for sku, data in products.items()}
 
-    def _assert_pos_session_exists(self, session_id: int) -> None:
-        """指定した POS セッションの存在と状態を検証する。
+    @staticmethod
+    def _check_unknown_skus(
+        lines: list[CheckoutLine], resolved: dict[str, Any]
+    ) -> None:
+        """解決できない SKU が含まれる場合に OdooJsonRpcError を送出する。
 
         Note:
-            - closing_control / closed のセッションは同期対象として受け付けない。
+            - 明細組み立て前にまとめて検査し、組み立てループを分岐なしに保つ。
         """
-        rows = self.client.call_kw(
-            model="pos.session",
-            method="search_read",
-            args=[
+        missing = [line.sku for line in lines if not resolved.get(line.sku)]
+        if missing:
+            raise OdooJsonRpcError(f"Unknown SKU: {', '.join(missing)}")
+
+    @staticmethod
+    def _pos_session_search_args(session_id: int) -> dict[str, Any]:
+        """pos.session.search_read に渡す args/kwargs を返す。"""
+        return {
+            "args": [
                 [["id", "=", session_id]],
                 ["id", "state"],
             ],
-            kwargs={"limit": 1},
-        ) or []
+            "kwargs": {"limit": 1},
+        }
+
+    @staticmethod
+    def _check_pos_session_rows(session_id: int, rows: list[dict[str, Any]]) -> None:
+        """pos.session.search_read の結果から存在と状態を検証する。
+
+        Note:
+            - closing_control / closed のセッションは同期対象として受け付けない。
+        """
         if not rows:
             raise OdooJsonRpcError(
                 "Unknown POS session: "
@@ -313,37 +875,66 @@ class OdooPosAdapter(PosAdapter):
                 f"POS session {session_id} is not writable (state={state})."
             )
 
+    def _pos_session_recently_checked(self, session_id: int) -> bool:
+        """POS セッションが有効期限内に検証済みかを返す。"""
+        expires_at = self._pos_session_checked.get(session_id)
+        return expires_at is not None and expires_at > time.monotonic()
+
+    def _mark_pos_session_checked(self, session_id: int) -> None:
+        """POS セッションを検証済みとして記録する。"""
+        ttl = self.cfg.pos_session_check_ttl_sec
+        if ttl > 0:
+            self._pos_session_checked[session_id] = time.monotonic() + ttl
+
+    def _assert_pos_session_exists(self, session_id: int) -> None:
+        """指定した POS セッションの存在と状態を検証する。
+
+        Note:
+            - 検証に成功したセッションは pos_session_check_ttl_sec の間
+              search_read を省略し、sync_from_ui の1往復のみで処理する。
+        """
+        if self._pos_session_recently_checked(session_id):
+            return
+        rows = self.client.call_kw(
+            model="pos.session",
+            method="search_read",
+            **self._pos_session_search_args(session_id),
+        ) or []
+        self._check_pos_session_rows(session_id, rows)
+        self._mark_pos_session_checked(session_id)
+
     # -------------------------
     # 案A：受注（sale.order）
     # -------------------------
 
-    def create_sale_order_draft(
+    def _build_sale_order_vals(
         self,
         partner_id: int,
         lines: list[CheckoutLine],
-        pricelist_id: Optional[int] = None,
-        note: Optional[str] = None,
-    ) -> int:
-        """sale.order を下書き（見積）で作成する。"""
-        # 入力明細から SKU 一覧を抽出し、商品IDへ解決する。
-        sku_list = [line.sku for line in lines]
-        sku_to_pid = self.resolve_product_ids_by_sku(sku_list)
+        resolved: dict[str, int],
+        pricelist_id: Optional[int],
+        note: Optional[str],
+    ) -> dict[str, Any]:
+        """sale.order.create に渡す本体値を組み立てる。"""
+        self._check_unknown_skus(lines, resolved)
 
         # Odoo One2many コマンド形式の order_line を組み立てる。
-        order_lines: list[tuple[int, int, dict[str, Any]]] = []
-        for line in lines:
-            pid = sku_to_pid.get(line.sku)
-            if not pid:
-                raise OdooJsonRpcError(f"Unknown SKU: {line.sku}")
-
-            vals: dict[str, Any] = {
-                "product_id": pid,
-                "product_uom_qty": line.qty,
-            }
-            if line.price_unit is not None:
-                vals["price_unit"] = line.price_unit
-
-            order_lines.append((0, 0, vals))
+        order_lines: list[tuple[int, int, dict[str, Any]]] = [
+            (
+                0,
+                0,
+                {
+                    "product_id": resolved[line.sku],
+                    "product_uom_qty": line.qty,
+                    **(
+                        {"price_unit": line.price_unit}
+                        if line.price_unit is not None
+                        else {}
+                    ),
+                },
+            )
+            for line in lines
+        ]
 
         # sale.order.create に渡す本体値。
         so_vals: dict[str, Any] = {"partner_id": partner_id, "order_line": order_lines}
@@ -351,6 +942,27 @@ class OdooPosAdapter(PosAdapter):
             so_vals["pricelist_id"] = pricelist_id
         if note:
             so_vals["note"] = note
+        return so_vals
+
+    def create_sale_order_draft(
+        self,
+        partner_id: int,
+        lines: list[CheckoutLine],
+        pricelist_id: Optional[int] = None,
+        note: Optional[str] = None,
+        resolved: Optional[dict[str, int]] = None,
+    ) -> int:
+        """sale.order を下書き（見積）で作成する。
+
+        Note:
+            - resolved を渡した場合は SKU 解決の call_kw を省略する。
+        """
+        # 入力明細を商品IDへ解決する（解決済みなら再利用する）。
+        if resolved is None:
+            resolved = self.resolve_product_ids_by_sku([line.sku for line in lines])
+        so_vals = self._build_sale_order_vals(
+            partner_id, lines, resolved, pricelist_id, note
+        )
 
         # 下書き受注を作成し、作成IDを返す。
         so_id = self.client.call_kw("sale.order", "create", args=[so_vals])
@@ -364,54 +976,91 @@ class OdooPosAdapter(PosAdapter):
             args=[[sale_order_id]],
         )
 
+    def create_confirmed_sale_order(
+        self,
+        partner_id: int,
+        lines: list[CheckoutLine],
+        pricelist_id: Optional[int] = None,
+        note: Optional[str] = None,
+        resolved: Optional[dict[str, int]] = None,
+    ) -> tuple[int, Any]:
+        """sale.order を作成・確定し、(受注ID, 確定結果) を返す。
+
+        Note:
+            - cfg.sale_create_and_confirm が有効なら scancheckout_sale アドオンの
+              create_and_confirm を呼び、往復を1回に減らす（確定結果は True）。
+            - 無効時は create → action_confirm の2回の call_kw で処理する。
+        """
+        if not self.cfg.sale_create_and_confirm:
+            so_id = self.create_sale_order_draft(
+                partner_id, lines, pricelist_id, note, resolved
+            )
+            return so_id, self.confirm_sale_order(so_id)
+
+        if resolved is None:
+            resolved = self.resolve_product_ids_by_sku([line.sku for line in lines])
+        so_vals = self._build_sale_order_vals(
+            partner_id, lines, resolved, pricelist_id, note
+        )
+        so_id = self.client.call_kw("sale.order", "create_and_confirm", args=[so_vals])
+        return int(so_id), True
+
     # -------------------------
     # 案B：POS（pos.order.sync_from_ui）
     # -------------------------
 
-    def build_pos_order_payload(
+    def _assemble_pos_order_payload(
         self,
         session_id: int,
         lines: list[CheckoutLine],
+        sku_to_product: dict[str, dict[str, Any]],
         partner_id: Optional[int],
-        draft: bool = True,
-        extra: Optional[dict[str, Any]] = None,
+        draft: bool,
+        extra: Optional[dict[str, Any]],
     ) -> dict[str, Any]:
-        """sync_from_ui に渡す 1件分の注文 payload を組み立てる。"""
-        # POS 明細の SKU を商品情報へ解決する。
-        sku_list = [line.sku for line in lines]
-        sku_to_product = self.resolve_products_by_sku(sku_list)
-
-        # sync_from_ui 用 lines（One2many コマンド形式）を生成する。
-        pos_lines: list[list[Any]] = []
-        order_total = 0.0
-        for line in lines:
-            product = sku_to_product.get(line.sku)
-            if not product:
-                raise OdooJsonRpcError(f"Unknown SKU: {line.sku}")
-
-            unit_price = (
-                float(line.price_unit)
+        """解決済み商品情報から sync_from_ui 用 payload を組み立てる。
+
+        主要変数:
+            unit_prices: 明細ごとの単価（未指定時は lst_price）。
+            subtotals: 明細ごとの小計（小数2桁へ丸め）。
+        """
+        self._check_unknown_skus(lines, sku_to_product)
+
+        unit_prices = [
+            (
+                line.price_unit
                 if line.price_unit is not None
-                else float(product["lst_price"])
+                else sku_to_product[line.sku]["lst_price"]
             )
-            subtotal = round(unit_price * line.qty, 2)
-            order_total += subtotal
-
-            line_vals: dict[str, Any] = {
-                "product_id": int(product["id"]),
-                "qty": line.qty,
-                "price_unit": unit_price,
-                "discount": 0.0,
-                "price_subtotal": subtotal,
-                "price_subtotal_incl": subtotal,
-                "tax_ids": [],
-            }
-
-            # One2many コマンド: [0, 0, vals]
-            pos_lines.append([0, 0, line_vals])
+            for line in lines
+        ]
+        subtotals = [
+            round(unit_price * line.qty, 2)
+            for line, unit_price in zip(lines, unit_prices)
+        ]
+        order_total = sum(subtotals)
+
+        # sync_from_ui 用 lines（One2many コマンド形式: [0, 0, vals]）を生成する。
+        pos_lines: list[list[Any]] = [
+            [
+                0,
+                0,
+                {
+                    "product_id": sku_to_product[line.sku]["id"],
+                    "qty": line.qty,
+                    "price_unit": unit_price,
+                    "discount": 0.0,
+                    "price_subtotal": subtotal,
+                    "price_subtotal_incl": subtotal,
+                    "tax_ids": [],
+                },
+            ]
+            for line, unit_price, subtotal in zip(lines, unit_prices, subtotals)
+        ]
 
         # sync_from_ui が受け取る order payload 本体（1件分）。
-        order_uuid = str(uuid4())
+        # pos.order.uuid は Char 項目のため、ハイフン整形を省いた hex 表現で十分。
+        order_uuid = uuid4().hex
         payload: dict[str, Any] = {
             "uuid": order_uuid,
             "session_id": session_id,
@@ -428,23 +1077,66 @@ class OdooPosAdapter(PosAdapter):
             payload.update(extra)
         return payload
 
-    def create_pos_order_from_ui(
+    def build_pos_order_payload(
         self,
         session_id: int,
         lines: list[CheckoutLine],
-        partner_id: Optional[int] = None,
+        partner_id: Optional[int],
         draft: bool = True,
         extra: Optional[dict[str, Any]] = None,
-    ) -> Any:
-        """pos.order.sync_from_ui を呼ぶ（Odoo 19 系）。"""
-        # Odoo 19 の最小実装では、未決済の draft 同期を優先する。
-        # draft=False は payment_ids 組み立ての版差が大きいため現時点では未対応。
+        resolved: Optional[dict[str, dict[str, Any]]] = None,
+    ) -> dict[str, Any]:
+        """sync_from_ui に渡す 1件分の注文 payload を組み立てる。
+
+        Note:
+            - resolved（resolve_products_by_sku の戻り値）を渡した場合は
+              SKU 解決の call_kw を省略する。
+            - 全明細に price_unit がある場合、lst_price は参照しないため
+              SKU 解決は ID のみで行う。
+        """
+        # POS 明細の SKU を商品情報へ解決する（解決済みなら再利用する）。
+        if resolved is None:
+            resolved = self._resolve_products(
+                [line.sku for line in lines], self._needs_list_price(lines)
+            )
+        return self._assemble_pos_order_payload(
+            session_id, lines, resolved, partner_id, draft, extra
+        )
+
+    @staticmethod
+    def _needs_list_price(lines: list[CheckoutLine]) -> bool:
+        """単価未指定（lst_price へフォールバックする）明細があるかを返す。"""
+        return any(line.price_unit is None for line in lines)
+
+    @staticmethod
+    def _ensure_pos_draft_supported(draft: bool) -> None:
+        """mode='pos' で未対応の draft=False を拒否する。
+
+        Note:
+            - Odoo 19 の最小実装では、未決済の draft 同期を優先する。
+            - draft=False は payment_ids 組み立ての版差が大きいため現時点では未対応。
+        """
         if not draft:
             raise OdooJsonRpcError(
                 "mode='pos' は現在 draft=True のみ対応です。"
                 "CREATE_POS_DRAFT=true を設定してください。"
             )
 
+    def create_pos_order_from_ui(
+        self,
+        session_id: int,
+        lines: list[CheckoutLine],
+        partner_id: Optional[int] = None,
+        draft: bool = True,
+        extra: Optional[dict[str, Any]] = None,
+        resolved: Optional[dict[str, dict[str, Any]]] = None,
+    ) -> Any:
+        """pos.order.sync_from_ui を呼ぶ（Odoo 19 系）。
+
+        Note:
+            - resolved は build_pos_order_payload へそのまま引き渡す。
+        """
+        self._ensure_pos_draft_supported(draft)
         self._assert_pos_session_exists(session_id)
 
         # まず版差調整可能な payload 生成処理を1か所に集約する。
@@ -454,31 +1146,53 @@ class OdooPosAdapter(PosAdapter):
             partner_id=partner_id,
             draft=draft,
             extra=extra,
+            resolved=resolved,
         )
         # sync_from_ui のシグネチャ: args=[[order_dict]]
-        return self.client.call_kw(
-            "pos.order",
-            "sync_from_ui",
-            args=[[order_payload]],
-            kwargs={},
-        )
+        try:
+            return self.client.call_kw(
+                "pos.order",
+                "sync_from_ui",
+                args=[[order_payload]],
+                kwargs={},
+            )
+        except Exception:
+            # セッションが閉じられた可能性があるため、次回は再検証する。
+            self._pos_session_checked.pop(session_id, None)
+            raise
 
     # -------------------------
     # API から呼ぶ入口（既定：sale.order）
     # -------------------------
 
+    @staticmethod
+    def _sale_checkout_failed(exc: Exception) -> CheckoutResult:
+        """sale.order フロー失敗時の共通結果を返す。"""
+        return CheckoutResult(
+            ok=False,
+            target="sale.order",
+            record_id=None,
+            raw=None,
+            message=str(exc),
+        )
+
     def checkout(self, req: CheckoutRequest) -> CheckoutResult:
-        """既定のチェックアウト処理（sale.order 下書き→確定）。"""
+        """既定のチェックアウト処理（sale.order 下書き→確定）。
+
+        Note:
+            - SKU 解決は要求1件につき1回だけ行い、下流処理へ引き渡す。
+        """
         try:
-            # 既定フロー: sale.order を作成する。
-            so_id = self.create_sale_order_draft(
+            # SKU -> product_id を一度だけ解決する。
+            resolved = self.resolve_product_ids_by_sku([line.sku for line in req.lines])
+            # 既定フロー: sale.order を作成して確定し、確認結果を保持する。
+            so_id, confirm_result = self.create_confirmed_sale_order(
                 partner_id=self.cfg.default_partner_id,
                 lines=req.lines,
                 pricelist_id=self.cfg.default_pricelist_id,
                 note=req.note,
+                resolved=resolved,
             )
-            # 作成した受注を確定し、確認結果を保持する。
-            confirm_result = self.confirm_sale_order(so_id)
             return CheckoutResult(
                 ok=True,
                 target="sale.order",
@@ -487,13 +1201,195 @@ class OdooPosAdapter(PosAdapter):
             )
         except Exception as exc:  # noqa: BLE001
             # 既定フロー失敗時も API 層が扱いやすい共通形式で返す。
+            return self._sale_checkout_failed(exc)
+
+    # -------------------------
+    # 非同期版（AsyncOdooJsonRpcClient 経由）
+    # -------------------------
+
+    async def aresolve_products_by_sku(
+        self, skus: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """resolve_products_by_sku の非同期版（キャッシュは同期版と共有）。"""
+        return await self._aresolve_products(skus, with_price=True)
+
+    async def _aresolve_products(
+        self, skus: list[str], with_price: bool
+    ) -> dict[str, dict[str, Any]]:
+        """_resolve_products の非同期版。"""
+        out, misses = self._lookup_sku_cache(skus, with_price)
+        if not misses:
+            return out
+
+        rows = await self._asearch_products(misses, with_price)
+        out.update(self._parse_product_rows(rows, with_price))
+        logger.debug("SKU 解決: 問い合わせ %d 件 / 取得 %d 件", len(misses), len(rows))
+        return out
+
+    async def _asearch_products_chunk(
+        self, skus: list[str], with_price: bool = True
+    ) -> list[dict[str, Any]]:
+        """_search_products_chunk の非同期版。"""
+        return (
+            await self.aclient.call_kw(
+                model="product.product",
+                method="search_read",
+                **self._product_search_args(skus, with_price),
+            )
+            or []
+        )
+
+    async def _asearch_products(
+        self, skus: list[str], with_price: bool = True
+    ) -> list[dict[str, Any]]:
+        """_search_products の非同期版（分割時は asyncio.gather で並行実行）。"""
+        if len(skus) <= _PARALLEL_SKU_THRESHOLD:
+            return await self._asearch_products_chunk(skus, with_price)
+
+        results = await asyncio.gather(
+            *(
+                self._asearch_products_chunk(chunk, with_price)
+                for chunk in _split_skus(skus)
+            )
+        )
+        return [row for rows in results for row in rows]
+
+    async def aresolve_product_ids_by_sku(self, skus: list[str]) -> dict[str, int]:
+        """resolve_product_ids_by_sku の非同期版。"""
+        products = await self._aresolve_products(skus, with_price=False)
+        return {sku: data["id"] for sku, data in products.items()}
+
+    async def _aassert_pos_session_exists(self, session_id: int) -> None:
+        """_assert_pos_session_exists の非同期版。"""
+        if self._pos_session_recently_checked(session_id):
+            return
+        rows = (
+            await self.aclient.call_kw(
+                model="pos.session",
+                method="search_read",
+                **self._pos_session_search_args(session_id),
+            )
+            or []
+        )
+        self._check_pos_session_rows(session_id, rows)
+        self._mark_pos_session_checked(session_id)
+
+    async def acreate_sale_order_draft(
+        self,
+        partner_id: int,
+        lines: list[CheckoutLine],
+        pricelist_id: Optional[int] = None,
+        note: Optional[str] = None,
+        resolved: Optional[dict[str, int]] = None,
+    ) -> int:
+        """create_sale_order_draft の非同期版。"""
+        if resolved is None:
+            resolved = await self.aresolve_product_ids_by_sku(
+                [line.sku for line in lines]
+            )
+        so_vals = self._build_sale_order_vals(
+            partner_id, lines, resolved, pricelist_id, note
+        )
+        so_id = await self.aclient.call_kw("sale.order", "create", args=[so_vals])
+        return int(so_id)
+
+    async def aconfirm_sale_order(self, sale_order_id: int) -> Any:
+        """confirm_sale_order の非同期版。"""
+        return await self.aclient.call_kw(
+            "sale.order",
+            "action_confirm",
+            args=[[sale_order_id]],
+        )
+
+    async def acreate_confirmed_sale_order(
+        self,
+        partner_id: int,
+        lines: list[CheckoutLine],
+        pricelist_id: Optional[int] = None,
+        note: Optional[str] = None,
+        resolved: Optional[dict[str, int]] = None,
+    ) -> tuple[int, Any]:
+        """create_confirmed_sale_order の非同期版。"""
+        if not self.cfg.sale_create_and_confirm:
+            so_id = await self.acreate_sale_order_draft(
+                partner_id, lines, pricelist_id, note, resolved
+            )
+            return so_id, await self.aconfirm_sale_order(so_id)
+
+        if resolved is None:
+            resolved = await self.aresolve_product_ids_by_sku(
+                [line.sku for line in lines]
+            )
+        so_vals = self._build_sale_order_vals(
+            partner_id, lines, resolved, pricelist_id, note
+        )
+        so_id = await self.aclient.call_kw(
+            "sale.order", "create_and_confirm", args=[so_vals]
+        )
+        return int(so_id), True
+
+    async def acreate_pos_order_from_ui(
+        self,
+        session_id: int,
+        lines: list[CheckoutLine],
+        partner_id: Optional[int] = None,
+        draft: bool = True,
+        extra: Optional[dict[str, Any]] = None,
+        resolved: Optional[dict[str, dict[str, Any]]] = None,
+    ) -> Any:
+        """create_pos_order_from_ui の非同期版。
+
+        Note:
+            - セッション検証と SKU 解決は互いに独立なため asyncio.gather で
+              並行実行し、Odoo への往復待ちを1回分に短縮する。
+        """
+        self._ensure_pos_draft_supported(draft)
+
+        if resolved is None:
+            _, resolved = await asyncio.gather(
+                self._aassert_pos_session_exists(session_id),
+                self._aresolve_products(
+                    [line.sku for line in lines], self._needs_list_price(lines)
+                ),
+            )
+        else:
+            await self._aassert_pos_session_exists(session_id)
+
+        order_payload = self._assemble_pos_order_payload(
+            session_id, lines, resolved, partner_id, draft, extra
+        )
+        try:
+            return await self.aclient.call_kw(
+                "pos.order",
+                "sync_from_ui",
+                args=[[order_payload]],
+                kwargs={},
+            )
+        except Exception:
+            self._pos_session_checked.pop(session_id, None)
+            raise
+
+    async def acheckout(self, req: CheckoutRequest) -> CheckoutResult:
+        """checkout の非同期版（sale.order 下書き→確定）。"""
+        try:
+            resolved = await self.aresolve_product_ids_by_sku(
+                [line.sku for line in req.lines]
+            )
+            so_id, confirm_result = await self.acreate_confirmed_sale_order(
+                partner_id=self.cfg.default_partner_id,
+                lines=req.lines,
+                pricelist_id=self.cfg.default_pricelist_id,
+                note=req.note,
+                resolved=resolved,
+            )
             return CheckoutResult(
-                ok=False,
+                ok=True,
                 target="sale.order",
-                record_id=None,
-                raw=None,
-                message=str(exc),
+                record_id=so_id,
+                raw={"confirm_result": confirm_result},
             )
+        except Exception as exc:  # noqa: BLE001
+            return self._sale_checkout_failed(exc)
 
 
 def build_odoo_adapter(
@@ -507,6 +1403,10 @@ def build_odoo_adapter(
     default_pos_session_id: Optional[int] = None,
     create_pos_draft: bool = True,
     sku_field: str = "default_code",
+    sale_create_and_confirm: bool = False,
+    pos_session_check_ttl_sec: float = 0.0,
+    sku_cache_max_size: int = 4096,
+    sku_cache_ttl_sec: float = 300.0,
 ) -> OdooPosAdapter:
     """設定値から OdooPosAdapter を生成する補助関数。"""
     # 受け取った引数を OdooConfig に集約する。
@@ -520,6 +1420,10 @@ def build_odoo_adapter(
         default_pos_session_id=default_pos_session_id,
         create_pos_draft=create_pos_draft,
         sku_field=sku_field,
+        sale_create_and_confirm=sale_create_and_confirm,
+        pos_session_check_ttl_sec=pos_session_check_ttl_sec,
+        sku_cache_max_size=sku_cache_max_size,
+        sku_cache_ttl_sec=sku_cache_ttl_sec,
     )
     # API 層はこのヘルパーで依存注入しやすくなる。
     return OdooPosAdapter(cfg)
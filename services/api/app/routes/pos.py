@@ -16,6 +16,7 @@ Odoo 連携モード
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import Any, Literal, Optional, overload
 
 from fastapi import APIRouter, HTTPException
@@ -191,6 +192,13 @@ def build_odoo_adapter_from_env() -> OdooPosAdapter:
     create_pos_draft = _env("CREATE_POS_DRAFT", "true").lower() == "true"
     # SKU 解決に使う Odoo フィールド（default_code / barcode など）。
     sku_field = _env("SKU_FIELD", "default_code")
+    # scancheckout_sale アドオンで sale.order の作成と確定を1回の RPC にするか。
+    sale_create_and_confirm = _env("SALE_CREATE_AND_CONFIRM", "false").lower() == "true"
+    # 書き込み可能と確認した POS セッションを記憶する秒数（0 で毎回検証）。
+    pos_session_check_ttl_sec = float(_env("POS_SESSION_CHECK_TTL_SEC", "0"))
+    # SKU 解決キャッシュの最大件数と有効秒数（0 以下でキャッシュ無効）。
+    sku_cache_max_size = int(_env("SKU_CACHE_MAX_SIZE", "4096"))
+    sku_cache_ttl_sec = float(_env("SKU_CACHE_TTL_SEC", "300"))
 
     # アダプタ設定オブジェクト。routes 層から Odoo 実装詳細を隠蔽する。
     cfg = OdooConfig(
@@ -203,37 +211,64 @@ def build_odoo_adapter_from_env() -> OdooPosAdapter:
         default_pos_session_id=default_pos_session_id,
         create_pos_draft=create_pos_draft,
         sku_field=sku_field,
+        sale_create_and_confirm=sale_create_and_confirm,
+        pos_session_check_ttl_sec=pos_session_check_ttl_sec,
+        sku_cache_max_size=sku_cache_max_size,
+        sku_cache_ttl_sec=sku_cache_ttl_sec,
     )
     # 以降の業務処理はこの adapter インスタンスを介して実行する。
     return OdooPosAdapter(cfg)
 
 
+@lru_cache(maxsize=1)
+def _pos_adapter_name() -> str:
+    """環境変数 POS_ADAPTER の値を返す（プロセス内で1回だけ読む）。"""
+    return _env("POS_ADAPTER", "odoo")
+
+
+@lru_cache(maxsize=1)
+def get_odoo_adapter() -> OdooPosAdapter:
+    """OdooPosAdapter のシングルトンを返す。
+
+    Note:
+        - 初回呼び出し時に build_odoo_adapter_from_env() で生成し、以降は
+          同じインスタンス（SKU キャッシュ・認証セッション）を再利用する。
+        - 環境変数の不足で生成に失敗した場合はキャッシュされない。
+          設定変更時は get_odoo_adapter.cache_clear() を呼ぶ。
+    """
+    return build_odoo_adapter_from_env()
+
+
 # ============================================================
 # ルート
 # ============================================================
 
 
 @router.post("/checkout", response_model=CheckoutOut)
-def checkout(body: CheckoutIn) -> CheckoutOut:
+async def checkout(body: CheckoutIn) -> CheckoutOut:
     """チェックアウト明細を Odoo に登録する。
 
     処理フロー:
-        1. 環境変数からアダプタ設定を構築
+        1. 共有アダプタを取得（初回のみ環境変数から構築）
         2. 入力明細を adapter 用モデルへ変換
         3. mode に応じて sale.order または pos.order を作成
+
+    Note:
+        - Odoo 呼び出しは adapter の非同期メソッド（a* 接頭辞）を await し、
+          RPC 待ちの間もイベントループ（他リクエスト）をブロックしない。
     """
 
     # 将来: POS_ADAPTER により dummy 等へ差し替え可能にする
     # 現在の実装は odoo のみ許可する。
-    adapter_name = _env("POS_ADAPTER", "odoo")
+    adapter_name = _pos_adapter_name()
     if adapter_name != "odoo":
         raise HTTPException(
             status_code=400,
             detail=f"未対応の POS_ADAPTER です: {adapter_name}",
         )
 
-    # Odoo 接続済みアダプタを生成する。
-    adapter = build_odoo_adapter_from_env()
+    # プロセス内で共有する Odoo アダプタを取得する。
+    adapter = get_odoo_adapter()
 
     # 入力行をアダプタ用に変換
     # body.lines（HTTP 入力） -> CheckoutLine（アプリ境界内モデル）
@@ -246,7 +281,7 @@ def checkout(body: CheckoutIn) -> CheckoutOut:
         if body.mode == "sale":
             # 受注（sale.order）: 下書き→確定
             # routes 層は I/O のみ担当し、Odoo 呼び出し詳細は adapter に委譲する。
-            result = adapter.checkout(
+            result = await adapter.acheckout(
                 CheckoutRequest(
                     # どの店舗・誰の操作かをログや追跡に使える形で渡す。
                     store_id=body.store_id,
@@ -276,7 +311,7 @@ def checkout(body: CheckoutIn) -> CheckoutOut:
         # 顧客はリクエスト指定を優先し、未指定時は既定顧客を利用する。
         partner_id = body.partner_id or adapter.cfg.default_partner_id
         # sync_from_ui の payload 組み立て/呼び出しは adapter 側で吸収する。
-        raw = adapter.create_pos_order_from_ui(
+        raw = await adapter.acreate_pos_order_from_ui(
             session_id=pos_session_id,
             lines=lines,
             partner_id=partner_id,
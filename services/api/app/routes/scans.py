@@ -17,7 +17,11 @@ from typing import Optional
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile
 from pydantic import BaseModel, Field
 
-from app.models.scan_store import get_scan_store
+from app.models.scan_store import (
+    EmptyScanImageError,
+    ScanImageTooLargeError,
+    get_scan_store,
+)
 from app.vision.infer import MODEL_VERSION, infer_topk_candidates
 
 router = APIRouter(prefix="/scans", tags=["scans"])
@@ -76,11 +80,21 @@ class InferOut(BaseModel):
     detections: list[DetectionOut]
 
 
-def _validate_upload_image(upload: UploadFile, image_bytes: bytes) -> None:
+def _upload_too_large() -> HTTPException:
+    """サイズ上限超過時の 413 例外を返す。"""
+    return HTTPException(
+        status_code=413,
+        detail=f"ファイルサイズ上限超過です（max={MAX_UPLOAD_SIZE_BYTES} bytes）。",
+    )
+
+
+def _validate_upload_image(upload: UploadFile) -> None:
     """アップロード画像の最小バリデーションを行う。
 
     Note:
-        - MVP では content_type とサイズのみを検査する。
+        - MVP では filename・content_type とサイズのみを検査する。
+        - multipart 解析時に判明したサイズ（UploadFile.size）で上限超過を
+          保存前に拒否する。サイズ不明時・空ファイルは保存時に検査する。
     """
     if not upload.filename:
         raise HTTPException(status_code=400, detail="filename が空です。")
@@ -92,14 +106,8 @@ def _validate_upload_image(upload: UploadFile, image_bytes: bytes) -> None:
             detail=f"画像ファイルのみ受け付けます: {content_type}",
         )
 
-    if not image_bytes:
-        raise HTTPException(status_code=400, detail="空ファイルは受け付けません。")
-
-    if len(image_bytes) > MAX_UPLOAD_SIZE_BYTES:
-        raise HTTPException(
-            status_code=413,
-            detail=f"ファイルサイズ上限超過です（max={MAX_UPLOAD_SIZE_BYTES} bytes）。",
-        )
+    if upload.size is not None and upload.size > MAX_UPLOAD_SIZE_BYTES:
+        raise _upload_too_large()
 
 
 @router.post("", response_model=ScanCreateOut)
@@ -108,18 +116,29 @@ def create_scan(
     store_id: str = Form(...),
     device_id: Optional[str] = Form(None),
 ) -> ScanCreateOut:
-    """画像を受け取り、scan_id を発行して保存する。"""
-    image_bytes = image.file.read()
-    _validate_upload_image(upload=image, image_bytes=image_bytes)
+    """画像を受け取り、scan_id を発行して保存する。
+
+    Note:
+        - 画像は全量を読み込まず、ストリームのままストアへ渡して保存する。
+    """
+    _validate_upload_image(upload=image)
 
     store = get_scan_store()
-    record = store.create_scan(
-        store_id=store_id,
-        device_id=device_id,
-        filename=image.filename or "upload.bin",
-        content_type=image.content_type or "application/octet-stream",
-        image_bytes=image_bytes,
-    )
+    try:
+        record = store.create_scan(
+            store_id=store_id,
+            device_id=device_id,
+            filename=image.filename or "upload.bin",
+            content_type=image.content_type or "application/octet-stream",
+            image=image.file,
+            max_bytes=MAX_UPLOAD_SIZE_BYTES,
+        )
+    except EmptyScanImageError as exc:
+        raise HTTPException(
+            status_code=400, detail="空ファイルは受け付けません。"
+        ) from exc
+    except ScanImageTooLargeError as exc:
+        raise _upload_too_large() from exc
     return ScanCreateOut(
         scan_id=record.scan_id,
         store_id=record.store_id,
@@ -127,7 +146,7 @@ def create_scan(
         image_uri=record.image_uri,
         content_type=record.content_type,
         size_bytes=record.size_bytes,
-        created_at=record.created_at.isoformat(),
+        created_at=record.created_at_dt.isoformat(),
     )
 
 
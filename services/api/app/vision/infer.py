@@ -6,19 +6,74 @@
 Note:
     - DB や外部 API には依存しない。
     - 推論精度を目的とせず、UI/業務フロー検証用の出力を返す。
+    - ハッシュ対象は先頭・末尾 _HASH_WINDOW_BYTES とバイト長のみ（dummy-hash-v2）。
+      同一バイト列からは常に同一候補を返すが、中間部のみ異なる画像は同一視される。
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from functools import lru_cache
 from hashlib import sha256
+from typing import NamedTuple
 
-MODEL_VERSION = "dummy-hash-v1"
+MODEL_VERSION = "dummy-hash-v2"
 
+# ハッシュ対象とする先頭・末尾の窓サイズ（バイト）。
+_HASH_WINDOW_BYTES = 4096
 
-@dataclass(frozen=True)
-class CandidatePrediction:
-    """推論候補1件を表す値オブジェクト。"""
+# MVP での固定候補カタログ（sku, name）。
+_CATALOG: tuple[tuple[str, str], ...] = (
+    ("TEST-SVC", "Demo Service SKU"),
+    ("TEST-SKU", "Demo Product TEST"),
+    ("BREAD-001", "Croissant"),
+    ("BREAD-002", "Baguette"),
+    ("CAKE-001", "Cheese Cake"),
+)
+_CATALOG_LEN = len(_CATALOG)
+# digest[0]（0-255）ごとに開始位置を回転させたカタログ。
+_ROTATIONS: tuple[tuple[tuple[str, str], ...], ...] = tuple(
+    tuple(_CATALOG[(start + rank) % _CATALOG_LEN] for rank in range(_CATALOG_LEN))
+    for start in range(256)
+)
+# ハッシュ由来ノイズの係数（1 / 2550）。
+_NOISE_SCALE = 1.0 / 2550.0
+
+
+def _sha256_digest(*chunks: bytes | memoryview) -> bytes:
+    """連結したバイト列の SHA-256 ダイジェストを返す。
+
+    Note:
+        - hashlib.sha256 は OpenSSL（EVP）実装であり、CPU が SHA-NI /
+          ARMv8 SHA 拡張を持つ場合は OpenSSL が実行時に専用命令へ切り替える。
+          追加の依存ライブラリは不要。
+    """
+    hasher = sha256()
+    for chunk in chunks:
+        hasher.update(chunk)
+    return hasher.digest()
+
+
+def _image_digest(image_bytes: bytes) -> bytes:
+    """画像の先頭・バイト長・末尾からダイジェストを求める。
+
+    Note:
+        - 画像サイズによらずハッシュ量は最大 2 * _HASH_WINDOW_BYTES + 8 バイト。
+        - memoryview のスライスでコピーせずに窓を切り出す。
+    """
+    view = memoryview(image_bytes)
+    return _sha256_digest(
+        view[:_HASH_WINDOW_BYTES],
+        len(image_bytes).to_bytes(8, "little"),
+        view[-_HASH_WINDOW_BYTES:],
+    )
+
+
+class CandidatePrediction(NamedTuple):
+    """推論候補1件を表す値オブジェクト。
+
+    Note:
+        - NamedTuple とし、frozen dataclass の __init__（object.__setattr__）を避ける。
+    """
 
     # 商品識別子（POS 連携で利用）。
     sku: str
@@ -28,39 +83,51 @@ class CandidatePrediction:
     score: float
 
 
-def infer_topk_candidates(image_bytes: bytes, top_k: int = 3) -> list[CandidatePrediction]:
+def infer_topk_candidates(
+    image_bytes: bytes, top_k: int = 3
+) -> tuple[CandidatePrediction, ...]:
     """画像バイト列から候補 TopK を生成する。
 
     主要変数:
-        digest: 画像バイト列のハッシュ値。
-        start_index: 候補カタログの開始オフセット。
-        score_noise: ハッシュ由来の微小ノイズ。
+        digest: 画像バイト列（先頭・長さ・末尾）のハッシュ値。
+
+    Note:
+        - 結果は (digest, top_k) をキーに _candidates_for_digest でメモ化する。
+          同一画像の再送・リトライ時はハッシュ計算のみで候補を返す。
+        - 戻り値はキャッシュと共有するため不変の tuple とする。
     """
     if top_k < 1:
         raise ValueError("top_k must be >= 1")
 
-    # MVP での固定候補カタログ。
-    catalog = [
-        ("TEST-SVC", "Demo Service SKU"),
-        ("TEST-SKU", "Demo Product TEST"),
-        ("BREAD-001", "Croissant"),
-        ("BREAD-002", "Baguette"),
-        ("CAKE-001", "Cheese Cake"),
-    ]
     if not image_bytes:
         image_bytes = b"empty-image"
 
-    digest = sha256(image_bytes).digest()
-    start_index = digest[0] % len(catalog)
-    max_count = min(top_k, len(catalog))
+    return _candidates_for_digest(_image_digest(image_bytes), top_k)
+
+
+@lru_cache(maxsize=1024)
+def _candidates_for_digest(
+    digest: bytes, top_k: int
+) -> tuple[CandidatePrediction, ...]:
+    """ダイジェストから候補 TopK を生成する。
+
+    主要変数:
+        rotated: digest[0] に応じて開始位置を回転済みのカタログ。
+        score_noise: ハッシュ由来の微小ノイズ。
+
+    Note:
+        - rank + 1 は最大 _CATALOG_LEN（5）でダイジェスト長（32）未満のため、
+          digest の添字に剰余は不要。
+    """
+    rotated = _ROTATIONS[digest[0]]
+    max_count = min(top_k, _CATALOG_LEN)
 
     predictions: list[CandidatePrediction] = []
     for rank in range(max_count):
-        idx = (start_index + rank) % len(catalog)
-        sku, name = catalog[idx]
-        score_noise = digest[(rank + 1) % len(digest)] / 2550.0
+        sku, name = rotated[rank]
+        score_noise = digest[rank + 1] * _NOISE_SCALE
         raw_score = 0.95 - (rank * 0.12) - score_noise
         score = round(max(0.01, min(0.99, raw_score)), 4)
         predictions.append(CandidatePrediction(sku=sku, name=name, score=score))
 
-    return predictions
+    return tuple(predictions)
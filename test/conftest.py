@@ -6,14 +6,20 @@
 - スキャンストアをテスト専用ディレクトリへ差し替え
 
 Note:
-    - `app.models.scan_store._SCAN_STORE` はグローバル状態のため、
-      各テストで初期化し直す。
+    - TestClient（アプリ生成・lifespan）はセッション単位で1回だけ起動する。
+    - `app.models.scan_store.get_scan_store` はシングルトンを lru_cache で保持するため、
+      各テストで SCAN_IMAGE_DIR を差し替えたうえで cache_clear() する。
+      テスト間で共有される可変状態はスキャンストアのみである。
+    - pytest-xdist（`pytest -n auto`）では各ワーカーが別プロセスのため、
+      セッション単位の TestClient・スキャンストア・共有 HTTP クライアントは
+      ワーカーごとに独立し、追加の排他は不要。画像は tmp_path 配下に保存する。
 """
 
 from __future__ import annotations
 
 import sys
 from pathlib import Path
+from typing import Iterator
 
 import pytest
 from fastapi.testclient import TestClient
@@ -25,12 +31,21 @@ API_ROOT = REPO_ROOT / "services" / "api"
 if str(API_ROOT) not in sys.path:
     sys.path.insert(0, str(API_ROOT))
 
-from app.main import app  # noqa: E402
+from app.main import create_app  # noqa: E402
 from app.models import scan_store as scan_store_module  # noqa: E402
 
 
+@pytest.fixture(scope="session")
+def _session_client() -> Iterator[TestClient]:
+    """セッション全体で共有する TestClient を返す（lifespan は1回のみ実行）。"""
+    with TestClient(create_app()) as test_client:
+        yield test_client
+
+
 @pytest.fixture
-def client(tmp_path: Path) -> TestClient:
+def client(
+    _session_client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[TestClient]:
     """テスト用 TestClient を返す。
 
     主要変数:
@@ -38,9 +53,9 @@ def client(tmp_path: Path) -> TestClient:
         image_dir: アップロード画像の保存先。
     """
     image_dir = tmp_path / "images"
-    scan_store_module._SCAN_STORE = scan_store_module.InMemoryScanStore(image_dir=image_dir)
+    monkeypatch.setenv("SCAN_IMAGE_DIR", str(image_dir))
+    scan_store_module.get_scan_store.cache_clear()
 
-    with TestClient(app) as test_client:
-        yield test_client
+    yield _session_client
 
-    scan_store_module._SCAN_STORE = None
+    scan_store_module.get_scan_store.cache_clear()
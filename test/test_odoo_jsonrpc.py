@@ -0,0 +1,633 @@
+"""Odoo JSON-RPC アダプタの単体テスト。
+
+検証対象
+- OdooJsonRpcClient の共有 HTTP クライアント / 認証セッション共有
+- OdooPosAdapter の SKU 解決（キャッシュ含む）
+- checkout / create_pos_order_from_ui での SKU 解決回数
+- 非同期版（acheckout / acreate_pos_order_from_ui）と POST /pos/checkout
+- アプリ再起動（lifespan 2回）後の共有クライアント再生成
+
+Note:
+    - Odoo へは接続せず、call_kw を記録するスタブクライアントへ差し替える。
+    - HTTP 層の検証は httpx.MockTransport を注入して行う。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Any, Iterator, Optional, Sequence
+
+import httpx
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from app.pos_adapters import odoo_jsonrpc
+from app.pos_adapters.odoo_jsonrpc import (
+    CheckoutLine,
+    CheckoutRequest,
+    OdooConfig,
+    OdooJsonRpcClient,
+    OdooJsonRpcError,
+    OdooPosAdapter,
+    close_pooled_http_clients,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_session_cache() -> Iterator[None]:
+    """テスト間で認証セッションキャッシュを共有しないよう初期化する。"""
+    odoo_jsonrpc._SESSION_CACHE.clear()
+    yield
+    odoo_jsonrpc._SESSION_CACHE.clear()
+
+
+class _StubClient:
+    """call_kw の呼び出しを記録し、登録済みの応答を返すスタブ。
+
+    主要変数:
+        products: sku_field 値 -> product.product 行の辞書。
+        calls: (model, method, args, kwargs) の呼び出し履歴。
+    """
+
+    def __init__(self, products: dict[str, dict[str, Any]]) -> None:
+        """応答に使う商品行を登録し、呼び出し履歴を空で初期化する。"""
+        self.products = products
+        self.calls: list[tuple[str, str, list[Any], dict[str, Any]]] = []
+
+    def call_kw(
+        self,
+        model: str,
+        method: str,
+        args: Sequence[Any] | None = None,
+        kwargs: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        """チェックアウトで利用する call_kw を模擬する。"""
+        args = list(args or [])
+        self.calls.append((model, method, args, kwargs or {}))
+        if (model, method) == ("product.product", "search_read"):
+            domain = args[0]
+            skus = domain[0][2]
+            return [self.products[sku] for sku in skus if sku in self.products]
+        if (model, method) == ("pos.session", "search_read"):
+            return [{"id": args[0][0][2], "state": "opened"}]
+        if (model, method) == ("sale.order", "create"):
+            return 101
+        if (model, method) == ("sale.order", "action_confirm"):
+            return True
+        if (model, method) == ("sale.order", "create_and_confirm"):
+            return 102
+        if (model, method) == ("pos.order", "sync_from_ui"):
+            return {"pos.order": [{"id": 201}]}
+        raise AssertionError(f"unexpected call_kw: {model}.{method}")
+
+    def count(self, model: str, method: str) -> int:
+        """指定した model.method の呼び出し回数を返す。"""
+        return sum(1 for call in self.calls if call[:2] == (model, method))
+
+
+class _AsyncStubClient:
+    """_StubClient を await 可能にするラッパ。"""
+
+    def __init__(self, stub: _StubClient) -> None:
+        """委譲先の同期スタブを保持し、同時実行数の計測を初期化する。"""
+        self.stub = stub
+        # 同時に await 中の call_kw 数と、その最大値。
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def call_kw(
+        self,
+        model: str,
+        method: str,
+        args: Sequence[Any] | None = None,
+        kwargs: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        """イベントループへ制御を返したうえで同期スタブへ委譲する。"""
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            return self.stub.call_kw(model, method, args=args, kwargs=kwargs)
+        finally:
+            self.in_flight -= 1
+
+
+# テスト用の既定 OdooConfig（frozen のため各テストで共有し、差分は replace で作る）。
+_CFG = OdooConfig(
+    base_url="http://odoo.invalid", db="odoo", username="admin", password="admin"
+)
+
+
+def _make_adapter(
+    products: dict[str, dict[str, Any]], **cfg_overrides: Any
+) -> tuple[OdooPosAdapter, _StubClient]:
+    """スタブクライアントを差し込んだアダプタを返す。"""
+    adapter = OdooPosAdapter(replace(_CFG, **cfg_overrides) if cfg_overrides else _CFG)
+    stub = _StubClient(products)
+    adapter.client = stub  # type: ignore[assignment]
+    adapter.aclient = _AsyncStubClient(stub)  # type: ignore[assignment]
+    return adapter, stub
+
+
+def test_clients_share_pooled_http_client_per_config() -> None:
+    """同一設定のクライアントが httpx.Client を共有することを確認する。"""
+    cfg = _CFG
+    first = OdooJsonRpcClient(cfg)
+    second = OdooJsonRpcClient(cfg)
+    shared = first._client
+
+    assert second._client is shared
+
+    close_pooled_http_clients()
+
+    assert shared.is_closed
+    assert OdooJsonRpcClient(cfg)._client is not shared
+    close_pooled_http_clients()
+
+
+class _MockOdooHttp:
+    """登録順に JSON を返す MockTransport 付き httpx.Client の共有ラッパ。
+
+    主要変数:
+        client: テストモジュール内で共有する httpx.Client。
+        paths: 受信したリクエストパスの履歴。
+        queue: 未返却のレスポンス JSON。
+    """
+
+    def __init__(self) -> None:
+        """空の履歴・応答キューと MockTransport 付きクライアントを生成する。"""
+        self.paths: list[str] = []
+        self.queue: list[dict[str, Any]] = []
+        self.client = httpx.Client(
+            base_url="http://odoo.invalid", transport=httpx.MockTransport(self._handle)
+        )
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        """キュー先頭の JSON を返す（authenticate では session cookie も返す）。"""
+        self.paths.append(request.url.path)
+        headers = {}
+        if request.url.path == "/web/session/authenticate":
+            headers["set-cookie"] = "session_id=abc; Path=/"
+        return httpx.Response(200, json=self.queue.pop(0), headers=headers)
+
+    def reset(self, responses: list[dict[str, Any]]) -> httpx.Client:
+        """履歴・cookie を破棄して応答を登録し、共有クライアントを返す。"""
+        self.paths.clear()
+        self.queue[:] = responses
+        self.client.cookies.clear()
+        return self.client
+
+
+@pytest.fixture(scope="module")
+def mock_http() -> Iterator[_MockOdooHttp]:
+    """モジュール内で1つの httpx.Client を共有する MockTransport を返す。"""
+    mock = _MockOdooHttp()
+    yield mock
+    mock.client.close()
+
+
+_AUTH_OK = {"jsonrpc": "2.0", "id": 1, "result": {"uid": 2}}
+
+
+def test_get_odoo_adapter_returns_singleton(monkeypatch: pytest.MonkeyPatch) -> None:
+    """routes 層のアダプタ取得がプロセス内で同一インスタンスを返すことを確認する。"""
+    from app.routes import pos as pos_routes
+
+    for name, value in [
+        ("ODOO_URL", "http://odoo.invalid"),
+        ("ODOO_DB", "odoo"),
+        ("ODOO_USER", "admin"),
+        ("ODOO_PASSWORD", "admin"),
+    ]:
+        monkeypatch.setenv(name, value)
+    pos_routes.get_odoo_adapter.cache_clear()
+
+    try:
+        assert pos_routes.get_odoo_adapter() is pos_routes.get_odoo_adapter()
+    finally:
+        pos_routes.get_odoo_adapter.cache_clear()
+        close_pooled_http_clients()
+
+
+def test_session_is_reused_across_client_instances(mock_http: _MockOdooHttp) -> None:
+    """別インスタンスでも認証済みセッションを再利用することを確認する。"""
+    http_client = mock_http.reset([_AUTH_OK, {"result": [1]}, {"result": [2]}])
+
+    OdooJsonRpcClient(_CFG, http_client=http_client).call_kw("res.users", "a")
+    OdooJsonRpcClient(_CFG, http_client=http_client).call_kw("res.users", "b")
+
+    assert mock_http.paths.count("/web/session/authenticate") == 1
+    assert mock_http.paths.count("/web/dataset/call_kw") == 2
+
+
+def test_concurrent_call_kw_authenticates_once() -> None:
+    """複数スレッドから同時に call_kw しても認証は1回だけであることを確認する。"""
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        """認証は遅延付きで成功させ、call_kw は常に成功を返す。"""
+        paths.append(request.url.path)
+        if request.url.path == "/web/session/authenticate":
+            # 他スレッドが認証待ちに入るよう応答を遅らせる。
+            time.sleep(0.05)
+            return httpx.Response(200, json=_AUTH_OK)
+        return httpx.Response(200, json={"result": True})
+
+    http_client = httpx.Client(
+        base_url="http://odoo.invalid", transport=httpx.MockTransport(handler)
+    )
+    client = OdooJsonRpcClient(_CFG, http_client=http_client)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: client.call_kw("res.users", "a"), range(4)))
+
+    assert paths.count("/web/session/authenticate") == 1
+    assert paths.count("/web/dataset/call_kw") == 4
+
+
+def test_concurrent_session_expiry_reauthenticates_once() -> None:
+    """複数スレッドが同時に期限切れを検知しても再認証は1回であることを確認する。"""
+    paths: list[str] = []
+    # サーバー側で有効なセッションID（None なら全セッション期限切れ）。
+    state: dict[str, Optional[str]] = {"valid": None}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        """有効なセッション cookie 以外の call_kw には期限切れエラーを返す。"""
+        paths.append(request.url.path)
+        if request.url.path == "/web/session/authenticate":
+            time.sleep(0.05)
+            session_id = f"s{paths.count(request.url.path)}"
+            state["valid"] = session_id
+            return httpx.Response(
+                200,
+                json=_AUTH_OK,
+                headers={"set-cookie": f"session_id={session_id}; Path=/"},
+            )
+        if request.headers.get("cookie") != f"session_id={state['valid']}":
+            return httpx.Response(
+                200, json={"error": {"code": 100, "message": "Odoo Session Expired"}}
+            )
+        return httpx.Response(200, json={"result": True})
+
+    http_client = httpx.Client(
+        base_url="http://odoo.invalid", transport=httpx.MockTransport(handler)
+    )
+    client = OdooJsonRpcClient(_CFG, http_client=http_client)
+    client.authenticate()
+    # 確立済みセッションをサーバー側で失効させる。
+    state["valid"] = None
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(lambda _: client.call_kw("res.users", "a"), range(8))
+        )
+
+    assert results == [True] * 8
+    assert paths.count("/web/session/authenticate") == 2
+
+
+def test_call_kw_reauthenticates_once_on_session_expired(
+    mock_http: _MockOdooHttp,
+) -> None:
+    """セッション期限切れ時に1回だけ再認証して再実行することを確認する。"""
+    expired = {"error": {"code": 100, "message": "Odoo Session Expired"}}
+    http_client = mock_http.reset([_AUTH_OK, expired, _AUTH_OK, {"result": 42}])
+    client = OdooJsonRpcClient(_CFG, http_client=http_client)
+
+    assert client.call_kw("sale.order", "create", args=[{}]) == 42
+    assert mock_http.paths == [
+        "/web/session/authenticate",
+        "/web/dataset/call_kw",
+        "/web/session/authenticate",
+        "/web/dataset/call_kw",
+    ]
+
+
+def test_call_kw_raises_when_session_expires_again(mock_http: _MockOdooHttp) -> None:
+    """再認証後も期限切れなら OdooJsonRpcError を送出することを確認する。"""
+    expired = {"error": {"code": 100, "message": "Odoo Session Expired"}}
+    http_client = mock_http.reset([_AUTH_OK, expired, _AUTH_OK, expired])
+    client = OdooJsonRpcClient(_CFG, http_client=http_client)
+
+    with pytest.raises(OdooJsonRpcError, match="Session Expired"):
+        client.call_kw("sale.order", "create", args=[{}])
+
+
+def test_call_kw_body_is_valid_jsonrpc_envelope() -> None:
+    """定数プレフィックスで組み立てた body が JSON-RPC として解釈できることを確認する。"""
+    body = odoo_jsonrpc._call_kw_body("sale.order", "create", [{"a": 1}], None)
+
+    assert orjson.loads(body) == {
+        "jsonrpc": "2.0",
+        "method": "call",
+        "id": 2,
+        "params": {
+            "model": "sale.order",
+            "method": "create",
+            "args": [{"a": 1}],
+            "kwargs": {},
+        },
+    }
+
+
+_PRODUCTS = {
+    "SKU-A": {"id": 11, "default_code": "SKU-A", "name": "A", "lst_price": 100.0},
+    "SKU-B": {"id": 12, "default_code": "SKU-B", "name": "B", "lst_price": 200.0},
+}
+
+
+def test_resolve_products_by_sku_serves_repeat_lookups_from_cache() -> None:
+    """同じ SKU の再解決で Odoo へ問い合わせないことを確認する。"""
+    adapter, stub = _make_adapter(_PRODUCTS)
+
+    first = adapter.resolve_product_ids_by_sku(["SKU-A", "SKU-B"])
+    second = adapter.resolve_product_ids_by_sku(["SKU-A", "SKU-B"])
+
+    assert first == second == {"SKU-A": 11, "SKU-B": 12}
+    assert len(stub.calls) == 1
+
+
+def test_resolve_products_by_sku_queries_only_cache_misses() -> None:
+    """キャッシュミス分の SKU のみが search_read の domain に含まれることを確認する。"""
+    adapter, stub = _make_adapter(_PRODUCTS)
+
+    adapter.resolve_product_ids_by_sku(["SKU-A"])
+    result = adapter.resolve_product_ids_by_sku(["SKU-A", "SKU-B"])
+
+    assert result == {"SKU-A": 11, "SKU-B": 12}
+    assert stub.calls[-1][2][0] == [["default_code", "in", ["SKU-B"]]]
+
+
+def test_resolve_products_by_sku_deduplicates_input() -> None:
+    """重複した SKU を問い合わせ domain に1件として渡すことを確認する。"""
+    adapter, stub = _make_adapter(_PRODUCTS)
+
+    adapter.resolve_products_by_sku(["SKU-A", "SKU-B", "SKU-A"])
+
+    assert stub.calls[0][2][0] == [["default_code", "in", ["SKU-A", "SKU-B"]]]
+
+
+def test_resolve_product_ids_by_sku_requests_id_fields_only() -> None:
+    """ID 解決は ["id", sku_field] のみを要求し、価格が必要な解決では再取得する。"""
+    adapter, stub = _make_adapter(_PRODUCTS)
+
+    adapter.resolve_product_ids_by_sku(["SKU-A"])
+    adapter.resolve_products_by_sku(["SKU-A"])
+    adapter.resolve_product_ids_by_sku(["SKU-A"])
+
+    assert [call[2][1] for call in stub.calls] == [
+        ["id", "default_code"],
+        ["id", "default_code", "name", "lst_price"],
+    ]
+
+
+def test_invalidate_sku_forces_refetch() -> None:
+    """invalidate_sku 後は Odoo へ再問い合わせすることを確認する。"""
+    adapter, stub = _make_adapter(_PRODUCTS)
+
+    adapter.resolve_product_ids_by_sku(["SKU-A"])
+    adapter.invalidate_sku("SKU-A")
+    adapter.resolve_product_ids_by_sku(["SKU-A"])
+
+    assert len(stub.calls) == 2
+
+
+def test_sku_cache_evicts_least_recently_used() -> None:
+    """最大件数を超えると最も古い SKU から破棄されることを確認する。"""
+    adapter, stub = _make_adapter(_PRODUCTS, sku_cache_max_size=1)
+
+    adapter.resolve_product_ids_by_sku(["SKU-A"])
+    adapter.resolve_product_ids_by_sku(["SKU-B"])
+    adapter.resolve_product_ids_by_sku(["SKU-A"])
+
+    assert len(stub.calls) == 3
+
+
+def test_resolve_products_by_sku_splits_large_batches() -> None:
+    """大量 SKU は分割して問い合わせ、結果を統合することを確認する。"""
+    products = {
+        f"SKU-{i}": {"id": i, "default_code": f"SKU-{i}", "name": "", "lst_price": 1}
+        for i in range(300)
+    }
+    adapter, stub = _make_adapter(products)
+
+    result = adapter.resolve_product_ids_by_sku(list(products))
+
+    assert result == {sku: row["id"] for sku, row in products.items()}
+    assert stub.count("product.product", "search_read") == 5
+
+    # キャッシュを無効にし、非同期版でも asyncio.gather の分割経路を通す。
+    aadapter, astub = _make_adapter(products, sku_cache_max_size=0)
+    assert asyncio.run(aadapter.aresolve_product_ids_by_sku(list(products))) == result
+    assert astub.count("product.product", "search_read") == 5
+
+
+def test_checkout_resolves_skus_once() -> None:
+    """sale.order 経路で SKU 解決の call_kw が1回だけであることを確認する。"""
+    adapter, stub = _make_adapter(_PRODUCTS, sku_cache_max_size=0)
+    req = CheckoutRequest(
+        store_id="store-01",
+        operator_id=None,
+        lines=[CheckoutLine(sku="SKU-A", qty=1), CheckoutLine(sku="SKU-B", qty=2)],
+    )
+
+    result = adapter.checkout(req)
+
+    assert result.ok is True
+    assert result.record_id == 101
+    assert stub.count("product.product", "search_read") == 1
+
+
+def test_create_pos_order_from_ui_resolves_skus_once() -> None:
+    """pos.order 経路で SKU 解決の call_kw が1回だけであることを確認する。"""
+    adapter, stub = _make_adapter(_PRODUCTS, sku_cache_max_size=0)
+
+    raw = adapter.create_pos_order_from_ui(
+        session_id=5,
+        lines=[CheckoutLine(sku="SKU-A", qty=1), CheckoutLine(sku="SKU-B", qty=2)],
+        partner_id=1,
+    )
+
+    assert raw == {"pos.order": [{"id": 201}]}
+    assert stub.count("product.product", "search_read") == 1
+
+
+def test_pos_order_skips_list_price_when_all_lines_priced() -> None:
+    """全明細に単価がある POS 注文では ID のみで SKU を解決することを確認する。"""
+    adapter, stub = _make_adapter(_PRODUCTS)
+    lines = [CheckoutLine(sku="SKU-A", qty=2, price_unit=150.0)]
+
+    payload = adapter.build_pos_order_payload(session_id=7, lines=lines, partner_id=1)
+
+    assert stub.calls[0][2][1] == ["id", "default_code"]
+    assert payload["amount_total"] == 300.0
+
+
+def test_pos_session_check_is_reused_within_ttl() -> None:
+    """検証済み POS セッションは TTL 内で search_read を省略することを確認する。"""
+    adapter, stub = _make_adapter(_PRODUCTS, pos_session_check_ttl_sec=30.0)
+    lines = [CheckoutLine(sku="SKU-A", qty=1)]
+
+    adapter.create_pos_order_from_ui(session_id=7, lines=lines)
+    asyncio.run(adapter.acreate_pos_order_from_ui(session_id=7, lines=lines))
+
+    assert stub.count("pos.session", "search_read") == 1
+    assert stub.count("pos.order", "sync_from_ui") == 2
+
+
+def test_acheckout_creates_and_confirms_sale_order() -> None:
+    """acheckout が sale.order を作成・確定することを確認する。"""
+    adapter, stub = _make_adapter(_PRODUCTS)
+    req = CheckoutRequest(
+        store_id="store-01",
+        operator_id=None,
+        lines=[CheckoutLine(sku="SKU-A", qty=1, price_unit=120.0)],
+    )
+
+    result = asyncio.run(adapter.acheckout(req))
+
+    assert result.ok is True
+    assert result.record_id == 101
+    assert stub.count("sale.order", "action_confirm") == 1
+
+
+def test_checkout_uses_create_and_confirm_when_enabled() -> None:
+    """アドオン利用時は作成と確定を1回の call_kw で行うことを確認する。"""
+    adapter, stub = _make_adapter(_PRODUCTS, sale_create_and_confirm=True)
+    req = CheckoutRequest(
+        store_id="store-01",
+        operator_id=None,
+        lines=[CheckoutLine(sku="SKU-A", qty=1)],
+    )
+
+    result = adapter.checkout(req)
+    aresult = asyncio.run(adapter.acheckout(req))
+
+    assert result.record_id == aresult.record_id == 102
+    assert stub.count("sale.order", "create_and_confirm") == 2
+    assert stub.count("sale.order", "create") == 0
+    assert stub.count("sale.order", "action_confirm") == 0
+
+
+def test_checkout_route_awaits_async_adapter(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """`POST /pos/checkout` が非同期アダプタ経由で受注を作成することを確認する。"""
+    from app.routes import pos as pos_routes
+
+    adapter, stub = _make_adapter(_PRODUCTS)
+    monkeypatch.setattr(pos_routes, "get_odoo_adapter", lambda: adapter)
+
+    response = client.post(
+        "/pos/checkout",
+        json={"store_id": "store-01", "lines": [{"sku": "SKU-A", "qty": 1}]},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["record_id"] == 101
+    assert stub.count("sale.order", "action_confirm") == 1
+
+
+def test_cached_adapter_survives_app_restart(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """lifespan 終了後も、キャッシュ済みアダプタで次のアプリが動くことを確認する。"""
+    from app.main import create_app
+    from app.routes import pos as pos_routes
+
+    stub = _StubClient(_PRODUCTS)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        """認証は成功させ、call_kw は _StubClient へ委譲する。"""
+        if request.url.path == "/web/session/authenticate":
+            return httpx.Response(200, json=_AUTH_OK)
+        params = orjson.loads(request.content)["params"]
+        result = stub.call_kw(
+            params["model"], params["method"], params["args"], params["kwargs"]
+        )
+        return httpx.Response(200, json={"result": result})
+
+    # 共有プールが生成する AsyncClient を MockTransport 付きにする。
+    monkeypatch.setattr(
+        httpx,
+        "AsyncClient",
+        functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)),
+    )
+    for name, value in [
+        ("ODOO_URL", "http://odoo.invalid"),
+        ("ODOO_DB", "odoo"),
+        ("ODOO_USER", "admin"),
+        ("ODOO_PASSWORD", "admin"),
+    ]:
+        monkeypatch.setenv(name, value)
+    pos_routes.get_odoo_adapter.cache_clear()
+
+    try:
+        for _ in range(2):
+            with TestClient(create_app()) as app_client:
+                response = app_client.post(
+                    "/pos/checkout",
+                    json={
+                        "store_id": "store-01",
+                        "lines": [{"sku": "SKU-A", "qty": 1}],
+                    },
+                )
+                assert response.status_code == 200
+                assert response.json()["record_id"] == 101
+    finally:
+        pos_routes.get_odoo_adapter.cache_clear()
+
+    assert stub.count("sale.order", "action_confirm") == 2
+
+
+def test_acheckout_reports_unknown_sku() -> None:
+    """acheckout が未登録 SKU を失敗結果として返すことを確認する。"""
+    adapter, _ = _make_adapter(_PRODUCTS)
+    req = CheckoutRequest(
+        store_id="store-01",
+        operator_id=None,
+        lines=[CheckoutLine(sku="SKU-X", qty=1)],
+    )
+
+    result = asyncio.run(adapter.acheckout(req))
+
+    assert result.ok is False
+    assert result.message == "Unknown SKU: SKU-X"
+
+
+def test_acreate_pos_order_from_ui_builds_payload() -> None:
+    """acreate_pos_order_from_ui が lst_price を単価に使うことを確認する。"""
+    adapter, stub = _make_adapter(_PRODUCTS)
+
+    raw = asyncio.run(
+        adapter.acreate_pos_order_from_ui(
+            session_id=5,
+            lines=[CheckoutLine(sku="SKU-B", qty=2)],
+            partner_id=1,
+        )
+    )
+
+    assert raw == {"pos.order": [{"id": 201}]}
+    order = stub.calls[-1][2][0][0]
+    assert order["session_id"] == 5
+    assert order["amount_total"] == 400.0
+    assert order["lines"][0][2]["price_unit"] == 200.0
+
+
+def test_acreate_pos_order_from_ui_overlaps_session_check_and_resolve() -> None:
+    """セッション検証と SKU 解決が同時に実行中となることを確認する。"""
+    adapter, stub = _make_adapter(_PRODUCTS)
+
+    asyncio.run(
+        adapter.acreate_pos_order_from_ui(
+            session_id=5, lines=[CheckoutLine(sku="SKU-A", qty=1)], partner_id=1
+        )
+    )
+
+    assert adapter.aclient.max_in_flight == 2  # type: ignore[attr-defined]
+    assert stub.count("pos.session", "search_read") == 1
@@ -4,6 +4,7 @@
 - GET /health
 - POST /scans
 - POST /scans/{scan_id}/infer
+- InMemoryScanStore のストリーム保存（サイズ上限）
 
 Note:
     - 認識はダミー推論のため、候補 SKU の固定値を厳密には固定しない。
@@ -12,16 +13,20 @@ Note:
 
 from __future__ import annotations
 
+import io
+from pathlib import Path
+
+import pytest
 from fastapi.testclient import TestClient
 
+from app.models import scan_store as scan_store_module
 
-def _sample_png_bytes() -> bytes:
-    """1x1 PNG 画像のバイト列を返す。"""
-    return (
-        b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01"
-        b"\x08\x04\x00\x00\x00\xb5\x1c\x0c\x02\x00\x00\x00\x0bIDATx\xdac\xfc\xff"
-        b"\x1f\x00\x03\x03\x02\x00\xee\x98\xc4\x9d\x00\x00\x00\x00IEND\xaeB`\x82"
-    )
+# 1x1 PNG 画像のバイト列。
+_SAMPLE_PNG = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01"
+    b"\x08\x04\x00\x00\x00\xb5\x1c\x0c\x02\x00\x00\x00\x0bIDATx\xdac\xfc\xff"
+    b"\x1f\x00\x03\x03\x02\x00\xee\x98\xc4\x9d\x00\x00\x00\x00IEND\xaeB`\x82"
+)
 
 
 def test_health_returns_ok(client: TestClient) -> None:
@@ -37,7 +42,7 @@ def test_create_scan_and_infer_success(client: TestClient) -> None:
     upload_response = client.post(
         "/scans",
         data={"store_id": "store-01", "device_id": "device-01"},
-        files={"image": ("sample.png", _sample_png_bytes(), "image/png")},
+        files={"image": ("sample.png", _SAMPLE_PNG, "image/png")},
     )
     assert upload_response.status_code == 200
 
@@ -53,7 +58,7 @@ def test_create_scan_and_infer_success(client: TestClient) -> None:
 
     infer_payload = infer_response.json()
     assert infer_payload["scan_id"] == scan_id
-    assert infer_payload["model_version"] == "dummy-hash-v1"
+    assert infer_payload["model_version"] == "dummy-hash-v2"
     assert len(infer_payload["detections"]) == 1
     assert infer_payload["detections"][0]["bbox"] == [0.0, 0.0, 1.0, 1.0]
     assert len(infer_payload["detections"][0]["candidates"]) == 3
@@ -76,6 +81,40 @@ def test_create_scan_rejects_non_image(client: TestClient) -> None:
     assert "画像ファイルのみ受け付けます" in response.json()["detail"]
 
 
+def test_create_scan_rejects_oversized_image(
+    client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """`POST /scans` が上限超過の画像を 413 で拒否し、ファイルを残さないことを確認する。"""
+    from app.routes import scans as scans_module
+
+    monkeypatch.setattr(scans_module, "MAX_UPLOAD_SIZE_BYTES", 16)
+    response = client.post(
+        "/scans",
+        data={"store_id": "store-01"},
+        files={"image": ("sample.png", _SAMPLE_PNG, "image/png")},
+    )
+
+    assert response.status_code == 413
+    assert not any((tmp_path / "images").glob("*"))
+
+
+def test_scan_store_rejects_stream_over_limit(tmp_path: Path) -> None:
+    """サイズ不明のストリームでも上限超過時に保存を中断することを確認する。"""
+    store = scan_store_module.InMemoryScanStore(image_dir=tmp_path)
+
+    with pytest.raises(scan_store_module.ScanImageTooLargeError):
+        store.create_scan(
+            store_id="store-01",
+            device_id=None,
+            filename="sample.png",
+            content_type="image/png",
+            image=io.BytesIO(_SAMPLE_PNG),
+            max_bytes=16,
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
+
 def test_infer_returns_404_for_unknown_scan(client: TestClient) -> None:
     """存在しない scan_id への推論要求が 404 を返すことを確認する。"""
     response = client.post("/scans/not-found-scan/infer", json={"top_k": 2})